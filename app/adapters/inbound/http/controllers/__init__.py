@@ -1,16 +1,37 @@
-from .agenda import AgendaCalendarsController, AgendaCategoriesController, AgendaComponentsController
-from .auth import AuthSessionsController, AuthUsersController
-from .chat_controller import ChatController
-from .health_controller import HealthController
-from .message_controller import MessageController
+"""
+Lazy re-exports for HTTP controllers (PEP 562).
 
-__all__ = [
-    'AgendaCalendarsController',
-    'AgendaCategoriesController',
-    'AgendaComponentsController',
-    'AuthSessionsController',
-    'AuthUsersController',
-    'ChatController',
-    'HealthController',
-    'MessageController',
-]
+Each controller module transitively pulls in litestar DTO machinery and
+`personal_growth_sdk` schemas, so importing them eagerly front-loads the whole
+dependency graph at process start. Controllers are imported on first attribute
+access instead, keeping cold start proportional to the routes actually used.
+"""
+
+from importlib import import_module
+
+_LAZY = {
+    'AgendaCalendarsController': '.agenda',
+    'AgendaCategoriesController': '.agenda',
+    'AgendaComponentsController': '.agenda',
+    'AuthSessionsController': '.auth',
+    'AuthUsersController': '.auth',
+    'ChatController': '.chat_controller',
+    'HealthController': '.health_controller',
+    'MessageController': '.message_controller',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    """
+    Import the controller's module on first access and cache it on the package.
+    """
+
+    try:
+        module = import_module(_LAZY[name], __name__)
+    except KeyError as exc:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from exc
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
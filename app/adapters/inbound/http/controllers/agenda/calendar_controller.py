@@ -18,11 +18,8 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Annotated
 
-import msgspec
-from advanced_alchemy.service import OffsetPagination
 from litestar import Controller, delete, get, patch, post
 from litestar._kwargs.dependencies import Dependency
-from litestar.di import Provide
 from litestar.openapi import ResponseSpec
 from litestar.params import Body, Parameter
 from litestar.response import Response
@@ -33,6 +30,7 @@ from personal_growth_sdk.agenda.schemas import (
     CalendarResponse,
 )
 
+from app.adapters.inbound.http.passthrough import passthrough
 from app.adapters.inbound.http.urls.agenda.calendar_urls import (
     DELETE_CALENDAR_URI,
     GET_CALENDAR_URI,
@@ -41,13 +39,16 @@ from app.adapters.inbound.http.urls.agenda.calendar_urls import (
     POST_CALENDAR_URI,
     PREFIX,
 )
-from app.infrastructure.di.providers import gateway_state_provider
+from app.infrastructure.di.providers import GW_STATE_DEPS
 from app.lib.context import GatewayState
 
 if TYPE_CHECKING:
     from advanced_alchemy.filters import FilterTypes
 __all__ = ['AgendaCalendarsController']
 
+# Shared parameter metadata: one Parameter instance per kind instead of one per handler
+_CalendarIdParam = Annotated[int, Parameter(description='Target calendar id')]
+
 
 class AgendaCalendarsController(Controller):
     """
@@ -60,9 +61,7 @@ class AgendaCalendarsController(Controller):
     """
 
     path = PREFIX
-    dependencies = {  # noqa: RUF012
-        'gw_state': Provide(gateway_state_provider, sync_to_thread=False)
-    }
+    dependencies = GW_STATE_DEPS  # noqa: RUF012
     tags = ['Agenda · Calendars']  # noqa: RUF012
 
     @get(
@@ -77,19 +76,10 @@ class AgendaCalendarsController(Controller):
             self,
             gw_state: GatewayState,
             filters: Annotated[list[FilterTypes], Dependency(skip_validation=True)]  # noqa: ARG002
-    ) -> OffsetPagination[CalendarResponse]:
-        """
-        Return a list of calendars visible to the authenticated user.
-
-        Args:
-            gw_state: Proxy context holding upstream response
-            filters: Optional filters for pagination/searching
-
-        Returns:
-            Paginated list of calendar records
-        """
+    ) -> Response[bytes]:
+        """Return a list of calendars visible to the authenticated user."""
 
-        return msgspec.json.decode(gw_state.upstream_raw, type=OffsetPagination[CalendarResponse])
+        return passthrough(gw_state.upstream_raw)
 
     @get(
         path=GET_CALENDAR_URI,
@@ -101,21 +91,12 @@ class AgendaCalendarsController(Controller):
     )
     async def get_calendar(
             self,
-            calendar_id: Annotated[int, Parameter(description='Target calendar id')],  # noqa: ARG002
+            calendar_id: _CalendarIdParam,  # noqa: ARG002
             gw_state: GatewayState,
-    ) -> CalendarResponse:
-        """
-        Retrieve a single calendar by its unique identifier.
+    ) -> Response[bytes]:
+        """Retrieve a single calendar by its unique identifier."""
 
-        Args:
-            calendar_id: Target calendar ID
-            gw_state: Proxy context holding upstream response
-
-        Returns:
-            The requested calendar object
-        """
-
-        return msgspec.json.decode(gw_state.upstream_raw, type=CalendarResponse)
+        return passthrough(gw_state.upstream_raw)
 
     @post(
         path=POST_CALENDAR_URI,
@@ -129,20 +110,10 @@ class AgendaCalendarsController(Controller):
             self,
             data: Annotated[CalendarCreateRequest, Body(title='Calendar data')],  # noqa: ARG002
             gw_state: GatewayState,
-    ) -> Response[CalendarResponse]:
-        """
-        Create a new calendar entry in the Agenda system.
-
-        Args:
-            data: New calendar creation payload
-            gw_state: Proxy context holding upstream response
+    ) -> Response[bytes]:
+        """Create a new calendar entry in the Agenda system."""
 
-        Returns:
-            Response containing the created calendar object
-        """
-
-        obj = msgspec.json.decode(gw_state.upstream_raw, type=CalendarResponse)
-        return Response(content=obj)
+        return passthrough(gw_state.upstream_raw, status_code=HTTP_201_CREATED)
 
     @patch(
         path=PATCH_CALENDAR_URI,
@@ -154,23 +125,13 @@ class AgendaCalendarsController(Controller):
     )
     async def patch_calendar(
             self,
-            calendar_id: Annotated[int, Parameter(description='Target calendar id')],  # noqa: ARG002
+            calendar_id: _CalendarIdParam,  # noqa: ARG002
             data: Annotated[CalendarPatchRequest, Body(title='Patch data')],  # noqa: ARG002
             gw_state: GatewayState,
-    ) -> CalendarResponse:
-        """
-        Apply partial updates to an existing calendar.
-
-        Args:
-            calendar_id: Target calendar ID
-            data: Fields to update
-            gw_state: Proxy context holding upstream response
-
-        Returns:
-            Updated calendar object
-        """
+    ) -> Response[bytes]:
+        """Apply partial updates to an existing calendar."""
 
-        return msgspec.json.decode(gw_state.upstream_raw, type=CalendarResponse)
+        return passthrough(gw_state.upstream_raw)
 
     @delete(
         path=DELETE_CALENDAR_URI,
@@ -181,17 +142,6 @@ class AgendaCalendarsController(Controller):
     )
     async def delete_calendar(
             self,
-            calendar_id: Annotated[int, Parameter(description='Target calendar id')]  # noqa: ARG002
+            calendar_id: _CalendarIdParam  # noqa: ARG002
     ) -> None:
-        """
-        Delete an existing calendar by ID.
-
-        Args:
-            calendar_id: ID of the calendar to delete
-            # gw_state: Proxy context used only to comply with middleware contract
-
-        Returns:
-            None
-        """
-
-        return None
+        """Delete an existing calendar by ID."""
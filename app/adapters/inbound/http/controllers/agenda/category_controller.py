@@ -17,15 +17,15 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
-import msgspec
 from litestar import Controller, get
-from litestar.di import Provide
 from litestar.openapi import ResponseSpec
+from litestar.response import Response
 from litestar.status_codes import HTTP_200_OK
 from personal_growth_sdk.agenda.schemas import CategoryResponse
 
+from app.adapters.inbound.http.passthrough import passthrough
 from app.adapters.inbound.http.urls.agenda.category_urls import GET_CATEGORIES_URI, PREFIX
-from app.infrastructure.di.providers import gateway_state_provider
+from app.infrastructure.di.providers import GW_STATE_DEPS
 from app.lib.context import GatewayState
 
 __all__ = ['AgendaCategoriesController']
@@ -42,9 +42,7 @@ class AgendaCategoriesController(Controller):
     """
 
     path = PREFIX
-    dependencies = {  # noqa: RUF012
-        'gw_state': Provide(gateway_state_provider, sync_to_thread=False)
-    }
+    dependencies = GW_STATE_DEPS  # noqa: RUF012
     tags = ['Agenda · Categories']  # noqa: RUF012
 
     @get(
@@ -56,15 +54,7 @@ class AgendaCategoriesController(Controller):
     async def list_categories(
             self,
             gw_state: GatewayState
-    ) -> Sequence[CategoryResponse]:
-        """
-        Return the list of predefined calendar categories from the Agenda service.
+    ) -> Response[bytes]:
+        """Return the list of predefined calendar categories from the Agenda service."""
 
-        Args:
-            gw_state: Proxy context holding the upstream response payload
-
-        Returns:
-            List of available `CategoryResponse` objects
-        """
-
-        return msgspec.json.decode(gw_state.upstream_raw, type=list[CategoryResponse])
+        return passthrough(gw_state.upstream_raw)
@@ -14,13 +14,11 @@ All responses are proxied via `ReverseProxyMiddleware` and decoded from
 """
 from __future__ import annotations
 
-import datetime  # noqa: TC003
+import datetime
 from collections.abc import Sequence
 from typing import Annotated
 
-import msgspec
 from litestar import Controller, delete, get, patch, post
-from litestar.di import Provide
 from litestar.openapi import ResponseSpec
 from litestar.params import Body, Parameter
 from litestar.response import Response
@@ -31,6 +29,7 @@ from personal_growth_sdk.agenda.schemas import (
     ComponentResponse,
 )
 
+from app.adapters.inbound.http.passthrough import passthrough
 from app.adapters.inbound.http.urls.agenda.component_urls import (
     DELETE_COMPONENT_URI,
     GET_COMPONENT_URI,
@@ -39,11 +38,16 @@ from app.adapters.inbound.http.urls.agenda.component_urls import (
     POST_COMPONENT_URI,
     PREFIX,
 )
-from app.infrastructure.di.providers import gateway_state_provider
+from app.infrastructure.di.providers import GW_STATE_DEPS
 from app.lib.context import GatewayState
 
 __all__ = ['AgendaComponentsController']
 
+# Shared parameter metadata: one Parameter instance per kind instead of one per handler
+_ComponentIdParam = Annotated[int, Parameter(description='Component id')]
+_StartDateParam = Annotated[datetime.datetime, Parameter(description='RFC3339 start timestamp')]
+_EndDateParam = Annotated[datetime.datetime, Parameter(description='RFC3339 end timestamp')]
+
 
 class AgendaComponentsController(Controller):
     """
@@ -56,9 +60,7 @@ class AgendaComponentsController(Controller):
     """
 
     path = PREFIX
-    dependencies = {  # noqa: RUF012
-        'gw_state': Provide(gateway_state_provider, sync_to_thread=False)
-    }
+    dependencies = GW_STATE_DEPS  # noqa: RUF012
     tags = ['Agenda · Components']  # noqa: RUF012
 
     @post(
@@ -71,21 +73,10 @@ class AgendaComponentsController(Controller):
             self,
             data: Annotated[ComponentCreateRequest, Body(title='Component data')],  # noqa: ARG002
             gw_state: GatewayState,
-    ) -> Response[ComponentResponse]:
-        """
-        Create a new calendar component in Agenda.
-
-        Args:
-            data: New component creation data
-            gw_state: Proxy context with upstream response
-
-        Returns:
-            Created component object
-        """
+    ) -> Response[bytes]:
+        """Create a new calendar component in Agenda."""
 
-        return Response(
-            content=msgspec.json.decode(gw_state.upstream_raw, type=ComponentResponse)
-        )
+        return passthrough(gw_state.upstream_raw, status_code=HTTP_201_CREATED)
 
     @get(
         path=GET_COMPONENT_URI,
@@ -95,21 +86,12 @@ class AgendaComponentsController(Controller):
     )
     async def get_component(
             self,
-            component_id: Annotated[int, Parameter(description='Component id')],  # noqa: ARG002
+            component_id: _ComponentIdParam,  # noqa: ARG002
             gw_state: GatewayState,
-    ) -> ComponentResponse:
-        """
-        Get a single calendar component by its ID.
+    ) -> Response[bytes]:
+        """Get a single calendar component by its ID."""
 
-        Args:
-            component_id: Target component ID
-            gw_state: Proxy context with upstream response
-
-        Returns:
-            Component object
-        """
-
-        return msgspec.json.decode(gw_state.upstream_raw, type=ComponentResponse)
+        return passthrough(gw_state.upstream_raw)
 
     @patch(
         path=PATCH_COMPONENT_URI,
@@ -119,28 +101,13 @@ class AgendaComponentsController(Controller):
     )
     async def patch_component(
             self,
-            component_id: Annotated[  # noqa: ARG002
-                int,
-                Parameter(
-                    description='Component id'
-                ),
-            ],
+            component_id: _ComponentIdParam,  # noqa: ARG002
             data: Annotated[ComponentPatchRequest, Body(title='Patch data')],  # noqa: ARG002
             gw_state: GatewayState,
-    ) -> ComponentResponse:
-        """
-        Apply partial update to a calendar component.
-
-        Args:
-            component_id: ID of the component to patch
-            data: Patch fields
-            gw_state: Proxy context with upstream response
+    ) -> Response[bytes]:
+        """Apply partial update to a calendar component."""
 
-        Returns:
-            Updated component
-        """
-
-        return msgspec.json.decode(gw_state.upstream_raw, type=ComponentResponse)
+        return passthrough(gw_state.upstream_raw)
 
     @delete(
         path=DELETE_COMPONENT_URI,
@@ -149,19 +116,9 @@ class AgendaComponentsController(Controller):
     )
     async def delete_component(
             self,
-            component_id: Annotated[int, Parameter(description='Component id')]  # noqa: ARG002
+            component_id: _ComponentIdParam  # noqa: ARG002
     ) -> None:
-        """
-        Delete a calendar component by ID.
-
-        Args:
-            component_id: ID of the component to delete
-
-        Returns:
-            None
-        """
-
-        return None
+        """Delete a calendar component by ID."""
 
     @get(
         path=GET_COMPONENTS_BY_RANGE_URI,
@@ -172,20 +129,10 @@ class AgendaComponentsController(Controller):
     )
     async def list_by_range(
             self,
-            start_date: Annotated[datetime.datetime, Parameter(description='RFC3339 start timestamp')],  # noqa: ARG002
-            end_date: Annotated[datetime.datetime, Parameter(description='RFC3339 end timestamp')],  # noqa: ARG002
+            start_date: _StartDateParam,  # noqa: ARG002
+            end_date: _EndDateParam,  # noqa: ARG002
             gw_state: GatewayState
-    ) -> Sequence[ComponentResponse]:
-        """
-        List calendar components between two timestamps.
-
-        Args:
-            start_date: Start timestamp (RFC3339)
-            end_date: End timestamp (RFC3339)
-            gw_state: Proxy context with upstream response
-
-        Returns:
-            List of components in the specified range
-        """
+    ) -> Response[bytes]:
+        """List calendar components between two timestamps."""
 
-        return msgspec.json.decode(gw_state.upstream_raw, type=list[ComponentResponse])
+        return passthrough(gw_state.upstream_raw)
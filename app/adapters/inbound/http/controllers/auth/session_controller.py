@@ -19,7 +19,6 @@ from typing import Annotated
 import msgspec
 from litestar import Controller, delete, post, put
 from litestar.datastructures import Cookie
-from litestar.di import Provide
 from litestar.openapi import ResponseSpec
 from litestar.params import Body
 from litestar.response import Response
@@ -27,6 +26,7 @@ from litestar.status_codes import HTTP_200_OK, HTTP_204_NO_CONTENT
 from personal_growth_sdk.authorization.constants.authentication import AUTH_ACCESS_TOKEN_KEY, AUTH_REFRESH_TOKEN_KEY
 from personal_growth_sdk.authorization.schemas import UserLoginRequest, UserResponse
 
+from app.adapters.inbound.http.passthrough import passthrough
 from app.adapters.inbound.http.urls.auth.auth_session_urls import (
     DELETE_SESSIONS,
     DELETE_SESSIONS_ALL,
@@ -35,11 +35,53 @@ from app.adapters.inbound.http.urls.auth.auth_session_urls import (
     PUT_SESSIONS,
 )
 from app.dto.user_dto import UserResponseDTO
-from app.infrastructure.di.providers import gateway_state_provider
+from app.infrastructure.di.providers import GW_STATE_DEPS
 from app.lib.context import GatewayState
 
 __all__ = ['AuthSessionsController']
 
+# Pre-built decoder reused across requests (schema compilation happens once per process)
+_USER_DECODER = msgspec.json.Decoder(UserResponse)
+
+# Frozen route metadata shared between decorators: Litestar and the OpenAPI
+# builder reuse these instead of fresh Cookie/ResponseSpec objects per handler.
+_ISSUE_TOKEN_COOKIES = (
+    Cookie(
+        key=AUTH_ACCESS_TOKEN_KEY,
+        description='Access token for authorization',
+        documentation_only=True,
+    ),
+    Cookie(
+        key=AUTH_REFRESH_TOKEN_KEY,
+        description='Refresh token for renewing access',
+        documentation_only=True,
+    ),
+)
+_REFRESH_TOKEN_COOKIES = (
+    Cookie(
+        key=AUTH_ACCESS_TOKEN_KEY,
+        description='New Access token (if successfully refreshed)',
+        documentation_only=True,
+    ),
+    Cookie(
+        key=AUTH_REFRESH_TOKEN_KEY,
+        description='Possibly new Refresh token (if server reissues it)',
+        documentation_only=True,
+    ),
+)
+_CLEAR_TOKEN_COOKIES = (
+    Cookie(
+        key=AUTH_ACCESS_TOKEN_KEY,
+        description='Access token removed',
+        documentation_only=True
+    ),
+    Cookie(
+        key=AUTH_REFRESH_TOKEN_KEY,
+        description='Refresh token removed',
+        documentation_only=True
+    ),
+)
+
 
 class AuthSessionsController(Controller):
     """
@@ -52,9 +94,7 @@ class AuthSessionsController(Controller):
     """
 
     path = PREFIX
-    dependencies = {  # noqa: RUF012
-        'gw_state': Provide(gateway_state_provider, sync_to_thread=False)
-    }
+    dependencies = GW_STATE_DEPS  # noqa: RUF012
     tags = ['Authentication · Session']  # noqa: RUF012
 
     @post(
@@ -69,18 +109,7 @@ class AuthSessionsController(Controller):
                 data_container=UserResponse
             )
         },
-        response_cookies=[
-            Cookie(
-                key=AUTH_ACCESS_TOKEN_KEY,
-                description='Access token for authorization',
-                documentation_only=True,
-            ),
-            Cookie(
-                key=AUTH_REFRESH_TOKEN_KEY,
-                description='Refresh token for renewing access',
-                documentation_only=True,
-            ),
-        ],
+        response_cookies=_ISSUE_TOKEN_COOKIES,
         return_dto=UserResponseDTO
 
     )
@@ -90,18 +119,11 @@ class AuthSessionsController(Controller):
             gw_state: GatewayState
 
     ) -> Response[UserResponse]:
-        """
-        Authenticate user and return session cookies.
-
-        Args:
-            data: Login payload
-            gw_state: Gateway response context with upstream user and cookies
-
-        Returns:
-            Response with user info and auth cookies
-        """
+        """Authenticate user and return session cookies."""
 
-        user = msgspec.json.decode(gw_state.upstream_raw, type=UserResponse)
+        # Raw-bytes passthrough is not possible here: return_dto=UserResponseDTO
+        # must see a decoded struct to apply its field filtering.
+        user = _USER_DECODER.decode(gw_state.upstream_raw)
         return Response(content=user, cookies=gw_state.upstream_cookies)
 
     @put(
@@ -116,18 +138,7 @@ class AuthSessionsController(Controller):
                 description='Token refreshed'
             )
         },
-        response_cookies=[
-            Cookie(
-                key=AUTH_ACCESS_TOKEN_KEY,
-                description='New Access token (if successfully refreshed)',
-                documentation_only=True,
-            ),
-            Cookie(
-                key=AUTH_REFRESH_TOKEN_KEY,
-                description='Possibly new Refresh token (if server reissues it)',
-                documentation_only=True,
-            ),
-        ]
+        response_cookies=_REFRESH_TOKEN_COOKIES
     )
     async def refresh_token(
             self,
@@ -140,19 +151,10 @@ class AuthSessionsController(Controller):
 
             ],
             gw_state: GatewayState
-    ) -> Response[None]:
-        """
-        Refresh the user's session token.
+    ) -> Response[bytes]:
+        """Refresh the user's session token."""
 
-        Args:
-            user_id: ID of the user (used for schema consistency)
-            gw_state: Gateway response context
-
-        Returns:
-            Empty response with updated cookies
-        """
-
-        return Response(content=None, cookies=gw_state.upstream_cookies)
+        return passthrough(b'', status_code=HTTP_204_NO_CONTENT, cookies=gw_state.upstream_cookies)
 
     @delete(
         path=DELETE_SESSIONS,
@@ -166,34 +168,15 @@ class AuthSessionsController(Controller):
                 description='Successfully logged out'
             )
         },
-        response_cookies=[
-            Cookie(
-                key=AUTH_ACCESS_TOKEN_KEY,
-                description='Access token removed',
-                documentation_only=True
-            ),
-            Cookie(
-                key=AUTH_REFRESH_TOKEN_KEY,
-                description='Refresh token removed',
-                documentation_only=True
-            ),
-        ]
+        response_cookies=_CLEAR_TOKEN_COOKIES
     )
     async def logout(
             self,
             gw_state: GatewayState
-    ) -> Response[None]:
-        """
-        Logout user and revoke the current session.
-
-        Args:
-            gw_state: Gateway state with cookie context
+    ) -> Response[bytes]:
+        """Logout user and revoke the current session."""
 
-        Returns:
-            Empty response with cookies cleared
-        """
-
-        return Response(content=None, cookies=gw_state.upstream_cookies)
+        return passthrough(b'', status_code=HTTP_204_NO_CONTENT, cookies=gw_state.upstream_cookies)
 
     @delete(
         path=DELETE_SESSIONS_ALL,
@@ -207,31 +190,12 @@ class AuthSessionsController(Controller):
                 description='All sessions terminated'
             )
         },
-        response_cookies=[
-            Cookie(
-                key=AUTH_ACCESS_TOKEN_KEY,
-                description='Access token removed',
-                documentation_only=True
-            ),
-            Cookie(
-                key=AUTH_REFRESH_TOKEN_KEY,
-                description='Refresh token removed',
-                documentation_only=True
-            ),
-        ]
+        response_cookies=_CLEAR_TOKEN_COOKIES
     )
     async def terminate_all_sessions(
             self,
             gw_state: GatewayState
-    ) -> Response[None]:
-        """
-        Revoke all user sessions (global logout).
-
-        Args:
-            gw_state: Gateway state with cookie context
-
-        Returns:
-            Empty response indicating all sessions have been revoked
-        """
+    ) -> Response[bytes]:
+        """Revoke all user sessions (global logout)."""
 
-        return Response(content=None, cookies=gw_state.upstream_cookies)
+        return passthrough(b'', status_code=HTTP_204_NO_CONTENT, cookies=gw_state.upstream_cookies)
@@ -19,20 +19,31 @@ from typing import Annotated
 import msgspec
 from litestar import Controller, get, post
 from litestar.di import Provide
-from litestar.dto import DTOConfig, MsgspecDTO
 from litestar.openapi import ResponseSpec
 from litestar.params import Body
+from litestar.response import Response
 from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED
 from personal_growth_sdk.authorization.schemas import UserCreateRequest, UserResponse
 
+from app.adapters.inbound.http.passthrough import passthrough
 from app.adapters.inbound.http.urls.auth.auth_user_urls import GET_CURRENT_USER_URI, POST_REGISTER_USER_URI, PREFIX
 
 __all__ = ['AuthUsersController']
 
-from app.infrastructure.di.providers import gateway_state_provider, role_required
+from app.infrastructure.di.providers import GW_STATE_DEPS, role_required
 from app.lib.context import GatewayState
 from app.lib.security import RoleGroup
 
+# Public projection of UserResponse served by `get_me`. Built once at import so
+# the hot path decodes the proxied body into the trimmed shape and encodes it
+# straight to bytes, without round-tripping through Litestar's DTO machinery.
+# The auth guard only keeps an id/role projection, so the full profile is read
+# from the upstream response this route already proxied.
+_USER_PUBLIC_FIELDS = tuple(f for f in UserResponse.__struct_fields__ if f != 'active_sessions')
+_UserPublic = msgspec.defstruct('_UserPublic', _USER_PUBLIC_FIELDS)
+_USER_PUBLIC_DECODER = msgspec.json.Decoder(_UserPublic)
+_USER_PUBLIC_ENCODER = msgspec.json.Encoder()
+
 
 class AuthUsersController(Controller):
     """
@@ -45,9 +56,7 @@ class AuthUsersController(Controller):
     """
 
     path = PREFIX
-    dependencies = {  # noqa: RUF012
-        'gw_state': Provide(gateway_state_provider, sync_to_thread=False)
-    }
+    dependencies = GW_STATE_DEPS  # noqa: RUF012
     tags = ['Authentication · Users']  # noqa: RUF012
 
     @post(
@@ -68,20 +77,10 @@ class AuthUsersController(Controller):
             self,
             data: Annotated[UserCreateRequest, Body(title='Register User')],  # noqa: ARG002
             gw_state: GatewayState,
-    ) -> UserResponse:
-        """
-        Register a new user account.
-
-        Args:
-            data: Registration payload
-            gw_state: Incoming request (used to extract upstream response)
-
-        Returns:
-            The created user profile
-        """
+    ) -> Response[bytes]:
+        """Register a new user account."""
 
-        user = msgspec.json.decode(gw_state.upstream_raw, type=UserResponse)
-        return user
+        return passthrough(gw_state.upstream_raw, status_code=HTTP_201_CREATED)
 
     @get(
         path=GET_CURRENT_USER_URI,
@@ -91,7 +90,6 @@ class AuthUsersController(Controller):
         description='Retrieve authenticated user profile information',
         dependencies={'_': Provide(role_required(RoleGroup.COMMON))},
         status_code=HTTP_200_OK,
-        return_dto=MsgspecDTO[Annotated[UserResponse, DTOConfig(exclude={'active_sessions'})]],
         responses={
             HTTP_200_OK: ResponseSpec(
                 data_container=UserResponse,
@@ -103,15 +101,8 @@ class AuthUsersController(Controller):
             self,
             gw_state: GatewayState,
             _: None
-    ) -> UserResponse:
-        """
-        Return the currently authenticated user's profile.
-
-        Args:
-            gw_state: Gateway context including authenticated user.
-
-        Returns:
-            UserResponse: The authenticated user's data.
-        """
+    ) -> Response[bytes]:
+        """Return the currently authenticated user's profile."""
 
-        return gw_state.auth_user
+        trimmed = _USER_PUBLIC_DECODER.decode(gw_state.upstream_raw)
+        return passthrough(_USER_PUBLIC_ENCODER.encode(trimmed))
@@ -11,14 +11,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Annotated
 
+import msgspec
+from advanced_alchemy.filters import LimitOffset
 from advanced_alchemy.service import OffsetPagination
-from litestar import Controller, delete, get, post, put
+from litestar import Controller, Request, Response, delete, get, post, put
 from litestar.di import Provide
 from litestar.openapi import ResponseSpec
 from litestar.params import Body, Dependency, Parameter
-from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
+from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED
 from personal_growth_sdk.multi_agent.schemas import ChatCreateRequest, ChatResponse, ChatUpdateRequest
 
+from app.adapters.inbound.http.passthrough import passthrough
 from app.adapters.inbound.http.urls.chat_urls import (
     DELETE_CHAT_URI,
     GET_CHAT_URI,
@@ -28,8 +31,11 @@ from app.adapters.inbound.http.urls.chat_urls import (
     PUT_CHAT_URI,
 )
 from app.application.services import ChatService
-from app.infrastructure.di.providers import gateway_state_provider, provide_chat_service, role_required
+from app.config.constants import DEFAULT_PAGINATION_SIZE
+from app.infrastructure.di.providers import GW_STATE_PROVIDE, provide_chat_service, role_required
 from app.lib.context import GatewayState
+from app.lib.http import make_etag
+from app.lib.schemas.cursor_pagination import CursorPagination
 from app.lib.security import RoleGroup
 
 if TYPE_CHECKING:
@@ -37,6 +43,25 @@ if TYPE_CHECKING:
 
 __all__ = ['ChatController']
 
+# Guard closure built once at import instead of per request
+_REQUIRE_PRIVATE = role_required(RoleGroup.PRIVATE)
+
+# List pages convert rows to schemas in one bulk msgspec.convert call against
+# this hoisted type instead of running the service's per-row to_schema path.
+_CHAT_LIST_TYPE = list[ChatResponse]
+_CHAT_ENCODER = msgspec.json.Encoder()
+
+# OpenAPI response specs hoisted to module level so spec assembly at
+# startup walks one shared object per handler outcome.
+_LIST_CHATS_200 = ResponseSpec(
+    data_container=OffsetPagination[ChatResponse],
+    description='Successfully retrieved list of chats'
+)
+_GET_CHAT_200 = ResponseSpec(data_container=ChatResponse, description='Successfully retrieved the chat')
+_CREATE_CHAT_201 = ResponseSpec(data_container=ChatResponse, description='Successfully created a new chat')
+_UPDATE_CHAT_200 = ResponseSpec(data_container=ChatResponse, description='Successfully updated the chat')
+_DELETE_CHAT_204 = ResponseSpec(data_container=ChatResponse, description='Successfully deleted the chat')
+
 
 class ChatController(Controller):
     """
@@ -51,7 +76,7 @@ class ChatController(Controller):
     path = PREFIX
     dependencies = {  # noqa: RUF012
         'chat_service': Provide(provide_chat_service),
-        'gw_state': Provide(gateway_state_provider, sync_to_thread=False)
+        'gw_state': GW_STATE_PROVIDE
     }
     tags = ['Chat']  # noqa: RUF012
 
@@ -62,34 +87,59 @@ class ChatController(Controller):
         summary='Get all chats',
         description='Retrieve a list of all chats (Private method for developers).',
         status_code=HTTP_200_OK,
-        responses={
-            HTTP_200_OK: ResponseSpec(
-                data_container=OffsetPagination[ChatResponse],
-                description='Successfully retrieved list of chats'
-            )
-        }
+        responses={HTTP_200_OK: _LIST_CHATS_200}
     )
     async def get_chats(
             self,
             gw_state: GatewayState,
             chat_service: ChatService,
-            filters: Annotated[list[FilterTypes], Dependency(skip_validation=True)]
-    ) -> OffsetPagination[ChatResponse]:
+            filters: Annotated[list[FilterTypes], Dependency(skip_validation=True)],
+            cursor: Annotated[
+                int | None,
+                Parameter(
+                    query='cursor',
+                    description='Keyset cursor: return records with an id below this value.',
+                    required=False
+                )
+            ] = None
+    ) -> OffsetPagination[ChatResponse] | CursorPagination[ChatResponse]:
         """
         Get paginated chat list.
 
+        Without a cursor the legacy LIMIT/OFFSET path is used; once a client
+        has a page it can follow `next_cursor` for keyset pagination, which
+        avoids the COUNT(*) and deep-offset scans.
+
         Args:
             gw_state: GatewayState containing request authentication and user session information.
             chat_service: Chat service
             filters: Query filters
+            cursor: Optional keyset cursor (id of the last record already seen)
 
         Returns:
             Paginated chat results
         """
 
-        await role_required(RoleGroup.PRIVATE)(gw_state)
-        results, total = await chat_service.list_and_count(*filters)
-        return chat_service.to_schema(data=results, total=total, filters=filters, schema_type=ChatResponse)
+        await _REQUIRE_PRIVATE(gw_state)
+        if cursor is not None:
+            limit = next(
+                (f.limit for f in filters if isinstance(f, LimitOffset)),
+                DEFAULT_PAGINATION_SIZE,
+            )
+            rows, next_cursor = await chat_service.repository.list_keyset(cursor=cursor, limit=limit)
+            return CursorPagination(
+                items=msgspec.convert(rows, type=_CHAT_LIST_TYPE, from_attributes=True),
+                limit=limit,
+                next_cursor=next_cursor,
+            )
+        results, total = await chat_service.repository.list_and_count_cached(*filters)
+        limit_offset = next((f for f in filters if isinstance(f, LimitOffset)), None)
+        return OffsetPagination(
+            items=msgspec.convert(results, type=_CHAT_LIST_TYPE, from_attributes=True),
+            limit=limit_offset.limit if limit_offset else DEFAULT_PAGINATION_SIZE,
+            offset=limit_offset.offset if limit_offset else 0,
+            total=total,
+        )
 
     @get(
         path=GET_CHAT_URI,
@@ -98,15 +148,11 @@ class ChatController(Controller):
         summary='Get a single chat',
         description='Retrieve a single chat by its ID (Private method for developers).',
         status_code=HTTP_200_OK,
-        responses={
-            HTTP_200_OK: ResponseSpec(
-                data_container=ChatResponse,
-                description='Successfully retrieved the chat'
-            )
-        }
+        responses={HTTP_200_OK: _GET_CHAT_200}
     )
     async def get_chat(
             self,
+            request: Request,
             gw_state: GatewayState,
             chat_service: ChatService,
             chat_id: Annotated[
@@ -116,22 +162,39 @@ class ChatController(Controller):
                     description='The ID of the chat to retrieve.'
                 )
             ]
-    ) -> ChatResponse:
+    ) -> Response[bytes]:
         """
-        Get single chat details.
+        Get single chat details, honouring conditional GETs.
+
+        When `If-None-Match` carries the current version tag only a timestamp
+        probe is issued and a 304 is returned, skipping the row load and
+        serialization entirely.
 
         Args:
+            request: Incoming request (read for the `If-None-Match` header).
             gw_state: GatewayState containing request authentication and user session information.
             chat_service: Chat service
             chat_id: Target chat ID
 
         Returns:
-            Detailed chat information
+            Detailed chat information, or an empty 304 when unchanged
         """
 
-        await role_required(RoleGroup.PRIVATE)(gw_state)
+        await _REQUIRE_PRIVATE(gw_state)
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            version = await chat_service.repository.get_updated_at(chat_id)
+            if version is not None and make_etag(chat_id, version) == if_none_match:
+                return passthrough(b'', status_code=HTTP_304_NOT_MODIFIED)
+
         db_obj = await chat_service.get(chat_id)
-        return chat_service.to_schema(db_obj, schema_type=ChatResponse)
+        return passthrough(
+            _CHAT_ENCODER.encode(msgspec.convert(db_obj, type=ChatResponse, from_attributes=True)),
+            headers={
+                'ETag': make_etag(chat_id, db_obj.updated_at),
+                'Cache-Control': 'private, max-age=0',
+            },
+        )
 
     @post(
         path=POST_CHAT_URI,
@@ -140,12 +203,7 @@ class ChatController(Controller):
         summary='Create a chat',
         description='Create a new chat with provided data (Private method for developers).',
         status_code=HTTP_201_CREATED,
-        responses={
-            HTTP_201_CREATED: ResponseSpec(
-                data_container=ChatResponse,
-                description='Successfully created a new chat'
-            )
-        }
+        responses={HTTP_201_CREATED: _CREATE_CHAT_201}
     )
     async def create_chat(
             self,
@@ -165,7 +223,7 @@ class ChatController(Controller):
             Newly created chat details
         """
 
-        await role_required(RoleGroup.PRIVATE)(gw_state)
+        await _REQUIRE_PRIVATE(gw_state)
         db_obj = await chat_service.create(data)
         return chat_service.to_schema(db_obj, schema_type=ChatResponse)
 
@@ -176,12 +234,7 @@ class ChatController(Controller):
         summary='Update a chat',
         description='Update an existing chat by ID (Private method for developers).',
         status_code=HTTP_200_OK,
-        responses={
-            HTTP_200_OK: ResponseSpec(
-                data_container=ChatResponse,
-                description='Successfully updated the chat'
-            )
-        }
+        responses={HTTP_200_OK: _UPDATE_CHAT_200}
     )
     async def update_chat(
             self,
@@ -209,7 +262,7 @@ class ChatController(Controller):
             Updated chat details
         """
 
-        await role_required(RoleGroup.PRIVATE)(gw_state)
+        await _REQUIRE_PRIVATE(gw_state)
         db_obj = await chat_service.update(data, chat_id)
         return chat_service.to_schema(db_obj, schema_type=ChatResponse)
 
@@ -220,12 +273,7 @@ class ChatController(Controller):
         summary='Delete a chat',
         description='Delete a chat by ID (Private method for developers).',
         status_code=HTTP_204_NO_CONTENT,
-        responses={
-            HTTP_204_NO_CONTENT: ResponseSpec(
-                data_container=ChatResponse,
-                description='Successfully deleted the chat'
-            )
-        }
+        responses={HTTP_204_NO_CONTENT: _DELETE_CHAT_204}
     )
     async def delete_chat(
             self,
@@ -247,5 +295,5 @@ class ChatController(Controller):
             chat_id: Target chat ID
         """
 
-        await role_required(RoleGroup.PRIVATE)(gw_state)
+        await _REQUIRE_PRIVATE(gw_state)
         await chat_service.delete(chat_id)
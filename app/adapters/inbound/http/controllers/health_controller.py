@@ -5,18 +5,23 @@ Provides system monitoring endpoints.
 
 from __future__ import annotations
 
-from litestar import Controller, get
+from litestar import Controller, Response, get
 from litestar.di import Provide
 from litestar.openapi import ResponseSpec
 from litestar.status_codes import HTTP_200_OK, HTTP_204_NO_CONTENT
 from personal_growth_sdk.lib.schemas.health_check_schema import HealthSchema
 
+from app.adapters.inbound.http.passthrough import passthrough
 from app.adapters.inbound.http.urls.health_urls import GET_HEALTH, GET_PING, PREFIX
 from app.application.services import HealthService
 from app.infrastructure.di.providers import provide_health_service
 
 __all__ = ['HealthController']
 
+# Liveness probes hit /ping constantly; one pre-built empty response is reused
+# instead of allocating a fresh one per poll.
+_PING_RESPONSE = passthrough(b'', status_code=HTTP_204_NO_CONTENT)
+
 
 class HealthController(Controller):
     """
@@ -78,7 +83,7 @@ class HealthController(Controller):
     )
     async def get_ping(
             self,
-    ) -> None:
+    ) -> Response[bytes]:
         """
         Basic liveness check endpoint.
 
@@ -86,4 +91,4 @@ class HealthController(Controller):
             Empty response (204) if service is alive
         """
 
-        return None
+        return _PING_RESPONSE
@@ -11,15 +11,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Annotated
 
+import msgspec
+from advanced_alchemy.filters import LimitOffset
 from advanced_alchemy.service import OffsetPagination
-from litestar import Controller, delete, get, post, put
+from litestar import Controller, Request, Response, delete, get, post, put
 from litestar.di import Provide
-from litestar.exceptions import HTTPException
 from litestar.openapi import ResponseSpec
 from litestar.params import Body, Dependency, Parameter
-from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT, HTTP_400_BAD_REQUEST
+from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED
 from personal_growth_sdk.multi_agent.schemas import MessageCreateRequest, MessageResponse, MessageUpdateRequest
 
+from app.adapters.inbound.http.passthrough import passthrough
 from app.adapters.inbound.http.urls.message_urls import (
     DELETE_MESSAGE_URI,
     GET_MESSAGE_URI,
@@ -30,14 +32,19 @@ from app.adapters.inbound.http.urls.message_urls import (
     PUT_MESSAGE_URI,
 )
 from app.application.services import MessageService
+from app.application.use_case.chat_exchange_service import ChatExchangeService
 from app.infrastructure.di.providers import (
-    gateway_state_provider,
+    GW_STATE_PROVIDE,
     provide_chat_exchange_service,
     provide_message_service,
     provide_snapshot_service,
     role_required,
 )
+from app.config.constants import DEFAULT_PAGINATION_SIZE
 from app.lib.context import GatewayState
+from app.lib.http import make_etag
+from app.lib.schemas.cursor_pagination import CursorPagination
+from app.lib.schemas.exchange_request import ExchangeRequest
 from app.lib.security import RoleGroup
 
 if TYPE_CHECKING:
@@ -45,6 +52,36 @@ if TYPE_CHECKING:
 
 __all__ = ['MessageController']
 
+# Guard closures built once at import instead of per request
+_REQUIRE_PRIVATE = role_required(RoleGroup.PRIVATE)
+_REQUIRE_COMMON = role_required(RoleGroup.COMMON)
+
+# List pages convert rows to schemas in one bulk msgspec.convert call against
+# this hoisted type instead of running the service's per-row to_schema path.
+_MESSAGE_LIST_TYPE = list[MessageResponse]
+
+# Shared encoder for handlers that serialize known msgspec schemas directly,
+# skipping Litestar's generic serialization path.
+_MSG_ENCODER = msgspec.json.Encoder()
+
+# OpenAPI response specs hoisted to module level so spec assembly at
+# startup walks one shared object per handler outcome.
+_LIST_MESSAGES_200 = ResponseSpec(
+    data_container=OffsetPagination[MessageResponse],
+    description='Successfully retrieved list of chat messages'
+)
+_GET_MESSAGE_200 = ResponseSpec(data_container=MessageResponse, description='Successfully retrieved the chat message')
+_CREATE_MESSAGE_201 = ResponseSpec(
+    data_container=MessageResponse,
+    description='Successfully created a new chat message'
+)
+_UPDATE_MESSAGE_200 = ResponseSpec(data_container=MessageResponse, description='Successfully updated the chat message')
+_DELETE_MESSAGE_204 = ResponseSpec(data_container=None, description='Successfully deleted the chat message')
+_EXCHANGE_201 = ResponseSpec(
+    data_container=list[MessageResponse],
+    description='Returns a list containing the user message and the assistant`s reply.'
+)
+
 
 class MessageController(Controller):
     """
@@ -59,7 +96,9 @@ class MessageController(Controller):
     path = PREFIX
     dependencies = {  # noqa: RUF012
         'message_service': Provide(provide_message_service),
-        'gw_state': Provide(gateway_state_provider, sync_to_thread=False)
+        'snapshot_service': Provide(provide_snapshot_service, sync_to_thread=False),
+        'chat_exchange_service': Provide(provide_chat_exchange_service, sync_to_thread=False),
+        'gw_state': GW_STATE_PROVIDE
     }
     tags = ['Message']  # noqa: RUF012
 
@@ -70,38 +109,58 @@ class MessageController(Controller):
         summary='Get all messages',
         description='Retrieve a list of all chat messages (Private method for developers).',
         status_code=HTTP_200_OK,
-        responses={
-            HTTP_200_OK: ResponseSpec(
-                data_container=OffsetPagination[MessageResponse],
-                description='Successfully retrieved list of chat messages'
-            )
-        }
+        responses={HTTP_200_OK: _LIST_MESSAGES_200}
     )
     async def get_messages(
             self,
             gw_state: GatewayState,
             message_service: MessageService,
-            filters: Annotated[list[FilterTypes], Dependency(skip_validation=True)]
-    ) -> OffsetPagination[MessageResponse]:
+            filters: Annotated[list[FilterTypes], Dependency(skip_validation=True)],
+            cursor: Annotated[
+                int | None,
+                Parameter(
+                    query='cursor',
+                    description='Keyset cursor: return records with an id below this value.',
+                    required=False
+                )
+            ] = None
+    ) -> OffsetPagination[MessageResponse] | CursorPagination[MessageResponse]:
         """
         Get paginated message list.
 
+        Without a cursor the legacy LIMIT/OFFSET path is used; once a client
+        has a page it can follow `next_cursor` for keyset pagination, which
+        avoids the COUNT(*) and deep-offset scans.
+
         Args:
             gw_state: GatewayState containing request authentication and user session information.
             message_service: Message service
             filters: Query filters
+            cursor: Optional keyset cursor (id of the last record already seen)
 
         Returns:
             Paginated message results
         """
 
-        await role_required(RoleGroup.PRIVATE)(gw_state)
-        results, total = await message_service.list_and_count(*filters)
-        return message_service.to_schema(
-            data=results,
+        await _REQUIRE_PRIVATE(gw_state)
+        if cursor is not None:
+            limit = next(
+                (f.limit for f in filters if isinstance(f, LimitOffset)),
+                DEFAULT_PAGINATION_SIZE,
+            )
+            rows, next_cursor = await message_service.repository.list_keyset(cursor=cursor, limit=limit)
+            return CursorPagination(
+                items=msgspec.convert(rows, type=_MESSAGE_LIST_TYPE, from_attributes=True),
+                limit=limit,
+                next_cursor=next_cursor,
+            )
+        results, total = await message_service.repository.list_and_count_cached(*filters)
+        limit_offset = next((f for f in filters if isinstance(f, LimitOffset)), None)
+        return OffsetPagination(
+            items=msgspec.convert(results, type=_MESSAGE_LIST_TYPE, from_attributes=True),
+            limit=limit_offset.limit if limit_offset else DEFAULT_PAGINATION_SIZE,
+            offset=limit_offset.offset if limit_offset else 0,
             total=total,
-            filters=filters,
-            schema_type=MessageResponse
         )
 
     @get(
@@ -111,15 +170,11 @@ class MessageController(Controller):
         summary='Get a single message',
         description='Retrieve a single chat message by its ID (Private method for developers).',
         status_code=HTTP_200_OK,
-        responses={
-            HTTP_200_OK: ResponseSpec(
-                data_container=MessageResponse,
-                description='Successfully retrieved the chat message'
-            )
-        }
+        responses={HTTP_200_OK: _GET_MESSAGE_200}
     )
     async def get_message(
             self,
+            request: Request,
             gw_state: GatewayState,
             message_service: MessageService,
             message_id: Annotated[
@@ -129,22 +184,39 @@ class MessageController(Controller):
                     description='The ID of the message to retrieve.'
                 )
             ]
-    ) -> MessageResponse:
+    ) -> Response[bytes]:
         """
-        Get single message details.
+        Get single message details, honouring conditional GETs.
+
+        When `If-None-Match` carries the current version tag only a timestamp
+        probe is issued and a 304 is returned, skipping the row load and
+        serialization entirely.
 
         Args:
+            request: Incoming request (read for the `If-None-Match` header).
             gw_state: GatewayState containing request authentication and user session information.
             message_service: Message service
             message_id: Target message ID
 
         Returns:
-            Detailed message information
+            Detailed message information, or an empty 304 when unchanged
         """
 
-        await role_required(RoleGroup.PRIVATE)(gw_state)
+        await _REQUIRE_PRIVATE(gw_state)
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            version = await message_service.repository.get_updated_at(message_id)
+            if version is not None and make_etag(message_id, version) == if_none_match:
+                return passthrough(b'', status_code=HTTP_304_NOT_MODIFIED)
+
         db_obj = await message_service.get(message_id)
-        return message_service.to_schema(db_obj, schema_type=MessageResponse)
+        return passthrough(
+            _MSG_ENCODER.encode(msgspec.convert(db_obj, type=MessageResponse, from_attributes=True)),
+            headers={
+                'ETag': make_etag(message_id, db_obj.updated_at),
+                'Cache-Control': 'private, max-age=0',
+            },
+        )
 
     @post(
         path=POST_MESSAGE_URI,
@@ -153,12 +225,7 @@ class MessageController(Controller):
         summary='Create a message',
         description='Create a new chat message with provided data (Private method for developers).',
         status_code=HTTP_201_CREATED,
-        responses={
-            HTTP_201_CREATED: ResponseSpec(
-                data_container=MessageResponse,
-                description='Successfully created a new chat message'
-            )
-        }
+        responses={HTTP_201_CREATED: _CREATE_MESSAGE_201}
     )
     async def create_message(
             self,
@@ -178,7 +245,7 @@ class MessageController(Controller):
             Newly created message details
         """
 
-        await role_required(RoleGroup.PRIVATE)(gw_state)
+        await _REQUIRE_PRIVATE(gw_state)
         db_obj = await message_service.create(data)
         return message_service.to_schema(db_obj, schema_type=MessageResponse)
 
@@ -189,12 +256,7 @@ class MessageController(Controller):
         summary='Update a message',
         description='Update an existing chat message by ID (Private method for developers).',
         status_code=HTTP_200_OK,
-        responses={
-            HTTP_200_OK: ResponseSpec(
-                data_container=MessageResponse,
-                description='Successfully updated the chat message'
-            )
-        }
+        responses={HTTP_200_OK: _UPDATE_MESSAGE_200}
     )
     async def update_message(
             self,
@@ -222,7 +284,7 @@ class MessageController(Controller):
             Updated message details
         """
 
-        await role_required(RoleGroup.PRIVATE)(gw_state)
+        await _REQUIRE_PRIVATE(gw_state)
         db_obj = await message_service.update(data, message_id)
         return message_service.to_schema(db_obj, schema_type=MessageResponse)
 
@@ -233,12 +295,7 @@ class MessageController(Controller):
         summary='Delete a message',
         description='Delete a chat message by ID (Private method for developers).',
         status_code=HTTP_204_NO_CONTENT,
-        responses={
-            HTTP_204_NO_CONTENT: ResponseSpec(
-                data_container=None,
-                description='Successfully deleted the chat message'
-            )
-        }
+        responses={HTTP_204_NO_CONTENT: _DELETE_MESSAGE_204}
     )
     async def delete_message(
             self,
@@ -261,7 +318,7 @@ class MessageController(Controller):
             message_id: Target message ID
         """
 
-        await role_required(RoleGroup.PRIVATE)(gw_state)
+        await _REQUIRE_PRIVATE(gw_state)
         await message_service.delete(message_id)
 
     @post(
@@ -272,20 +329,15 @@ class MessageController(Controller):
         description='Sends a user message to a chat and returns both the saved user message '
                     'and the assistant`s generated response.',
         status_code=HTTP_201_CREATED,
-        responses={
-            HTTP_201_CREATED: ResponseSpec(
-                data_container=list[MessageResponse],
-                description='Returns a list containing the user message and the assistant`s reply.'
-            )
-        },
+        responses={HTTP_201_CREATED: _EXCHANGE_201},
     )
     async def exchange(
             self,
             gw_state: GatewayState,
             chat_id: int,
-            data: Annotated[MessageCreateRequest, Body(title='User message')],
-            message_service: MessageService
-    ) -> list[MessageResponse]:
+            data: Annotated[ExchangeRequest, Body(title='User message')],
+            chat_exchange_service: ChatExchangeService
+    ) -> Response[bytes]:
         """
         Send a user message and receive an assistant response.
 
@@ -293,24 +345,17 @@ class MessageController(Controller):
             gw_state: GatewayState containing request authentication and user session information.
             chat_id: ID of the chat where the message is being sent.
             data: User message content to send.
-            message_service: Service responsible for message operations.
+            chat_exchange_service: Orchestrates persistence, snapshot capture and AI reply.
 
         Returns:
             A response containing both the user message and the assistant's generated reply.
         """
 
-        await role_required(RoleGroup.COMMON)(gw_state)
-        if chat_id != data.chat_id:
-            raise HTTPException(status_code=HTTP_400_BAD_REQUEST)
-
-        chat_exchange_service = provide_chat_exchange_service(
-            message_service=message_service,
-            snapshot_service=await provide_snapshot_service()
-        )
+        await _REQUIRE_COMMON(gw_state)
         result = await chat_exchange_service.exchange(
             user_id=gw_state.auth_user.id,
-            chat_id=data.chat_id,
+            chat_id=chat_id,
             message=data.content
         )
 
-        return result
+        return passthrough(_MSG_ENCODER.encode(result), status_code=HTTP_201_CREATED)
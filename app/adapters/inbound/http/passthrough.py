@@ -0,0 +1,50 @@
+"""
+Raw-bytes passthrough helper for proxy controllers.
+
+Upstream services already return fully serialized JSON. For handlers that do not
+transform the payload, decoding into msgspec Structs only so Litestar can
+re-encode the same fields is a wasted decode/encode round-trip. This helper
+returns the upstream bytes verbatim with `media_type=application/json`, which
+bypasses Litestar's serialization pipeline entirely.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from litestar.enums import MediaType
+from litestar.response import Response
+from litestar.status_codes import HTTP_200_OK
+
+if TYPE_CHECKING:
+    from litestar.datastructures import Cookie
+
+__all__ = ['passthrough']
+
+
+def passthrough(
+        raw: bytes,
+        status_code: int = HTTP_200_OK,
+        cookies: list[Cookie] | None = None,
+        headers: dict[str, str] | None = None,
+) -> Response[bytes]:
+    """
+    Build a response that emits the upstream payload without re-serialization.
+
+    Args:
+        raw: Raw JSON body received from the upstream service.
+        status_code: HTTP status code to return to the client.
+        cookies: Optional cookies to attach to the response.
+        headers: Optional extra headers to attach to the response.
+
+    Returns:
+        Response emitting `raw` verbatim as `application/json`.
+    """
+
+    return Response(
+        content=raw,
+        media_type=MediaType.JSON,
+        status_code=status_code,
+        cookies=cookies,
+        headers=headers,
+    )
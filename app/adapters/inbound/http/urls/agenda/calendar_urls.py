@@ -3,12 +3,15 @@ Calendar endpoint URL configurations.
 Supports CRUD operations on user calendars.
 """
 
+import sys
+from typing import Final
+
 from .root_prefix import ROOT_PREFIX
 
-PREFIX = f'{ROOT_PREFIX}/calendars'  # Base path for calendar management
+PREFIX: Final[str] = sys.intern(f'{ROOT_PREFIX}/calendars')  # Base path for calendar management
 
-GET_CALENDARS_URI = '/'  # List all calendars
-GET_CALENDAR_URI = '/{calendar_id:int}'  # Get calendar by ID
-POST_CALENDAR_URI = '/'  # Create new calendar
-PATCH_CALENDAR_URI = '/{calendar_id:int}'  # Update calendar
-DELETE_CALENDAR_URI = '/{calendar_id:int}'  # Delete calendar
+GET_CALENDARS_URI: Final[str] = '/'  # List all calendars
+GET_CALENDAR_URI: Final[str] = '/{calendar_id:int}'  # Get calendar by ID
+POST_CALENDAR_URI: Final[str] = '/'  # Create new calendar
+PATCH_CALENDAR_URI: Final[str] = '/{calendar_id:int}'  # Update calendar
+DELETE_CALENDAR_URI: Final[str] = '/{calendar_id:int}'  # Delete calendar
@@ -3,8 +3,11 @@ Category endpoint URL configurations.
 Provides access to read-only category collection used in Agenda.
 """
 
+import sys
+from typing import Final
+
 from .root_prefix import ROOT_PREFIX
 
-PREFIX = f'{ROOT_PREFIX}/categories'  # Base path for category operations
+PREFIX: Final[str] = sys.intern(f'{ROOT_PREFIX}/categories')  # Base path for category operations
 
-GET_CATEGORIES_URI = '/'  # List all available categories
+GET_CATEGORIES_URI: Final[str] = '/'  # List all available categories
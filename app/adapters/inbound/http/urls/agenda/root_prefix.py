@@ -3,4 +3,6 @@ Defines the base route prefix for all agenda-related endpoints.
 Used for calendars, components, categories, etc.
 """
 
-ROOT_PREFIX = '/agenda'
+from typing import Final
+
+ROOT_PREFIX: Final[str] = '/agenda'
@@ -3,12 +3,15 @@ Authentication session endpoint URL configurations.
 Defines routes for session lifecycle: login, refresh, logout.
 """
 
+import sys
+from typing import Final
+
 from .root_prefix import ROOT_PREFIX
 
-PREFIX = f'{ROOT_PREFIX}/sessions'  # Base path for session management
+PREFIX: Final[str] = sys.intern(f'{ROOT_PREFIX}/sessions')  # Base path for session management
 
 # Session management endpoints
-POST_SESSIONS = ''  # Login → Create new session (issue access + refresh tokens)
-PUT_SESSIONS = ''  # Refresh - Renew access token using refresh token
-DELETE_SESSIONS = ''  # Logout - Revoke current session tokens
-DELETE_SESSIONS_ALL = '/all'  # Logout all - Revoke all active sessions for the user
+POST_SESSIONS: Final[str] = ''  # Login → Create new session (issue access + refresh tokens)
+PUT_SESSIONS: Final[str] = ''  # Refresh - Renew access token using refresh token
+DELETE_SESSIONS: Final[str] = ''  # Logout - Revoke current session tokens
+DELETE_SESSIONS_ALL: Final[str] = '/all'  # Logout all - Revoke all active sessions for the user
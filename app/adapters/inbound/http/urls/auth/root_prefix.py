@@ -3,4 +3,6 @@ Defines the base route prefix for all authentication-related endpoints.
 Used in session and user route definitions.
 """
 
-ROOT_PREFIX = '/auth'
+from typing import Final
+
+ROOT_PREFIX: Final[str] = '/auth'
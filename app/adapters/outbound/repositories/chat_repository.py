@@ -3,8 +3,14 @@ Database repository for Chat model.
 Handles basic database operations for user entities.
 """
 
+import time
+from datetime import datetime
+from typing import ClassVar
+
+from advanced_alchemy.filters import FilterTypes
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
 from personal_growth_sdk.multi_agent.models import Chat
+from sqlalchemy import select
 
 __all__ = ['ChatRepository']
 
@@ -15,3 +21,82 @@ class ChatRepository(SQLAlchemyAsyncRepository[Chat]):
     """
 
     model_type = Chat  # Specifies the SQLAlchemy model class
+
+    _COUNT_TTL = 5.0
+    _count_cache: ClassVar[dict[str, tuple[float, int]]] = {}
+
+    async def list_keyset(
+            self,
+            cursor: int | None,
+            limit: int,
+    ) -> tuple[list[Chat], int | None]:
+        """
+        Fetch one page of chats via keyset pagination.
+
+        Pages with an index range scan (`id < cursor ORDER BY id DESC`) instead
+        of LIMIT/OFFSET, so deep pages do not re-scan skipped rows and no
+        COUNT(*) is issued.
+
+        Args:
+            cursor: Last `id` seen on the previous page, or None for the first page.
+            limit: Maximum number of rows to return.
+
+        Returns:
+            Tuple of (rows, next_cursor); next_cursor is None on the last page.
+        """
+
+        stmt = select(Chat).order_by(Chat.id.desc()).limit(limit + 1)
+        if cursor is not None:
+            stmt = stmt.where(Chat.id < cursor)
+
+        result = await self.session.execute(stmt)
+        rows = list(result.scalars())
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1].id
+        return rows, next_cursor
+
+    async def list_and_count_cached(self, *filters: FilterTypes) -> tuple[list[Chat], int]:
+        """
+        List rows and return the total, reusing a recently computed COUNT.
+
+        The COUNT(*) half of `list_and_count` is invariant between page loads
+        of the same filtered listing, so its result is cached in-process for
+        `_COUNT_TTL` seconds keyed on the filters' repr. On a hit only the row
+        query is executed.
+
+        Args:
+            *filters: Filters to apply to the query.
+
+        Returns:
+            Tuple of (rows, total count).
+        """
+
+        key = repr(filters)
+        now = time.monotonic()
+        cached = self._count_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return await self.list(*filters), cached[1]
+
+        rows, total = await self.list_and_count(*filters)
+        if len(self._count_cache) >= 256:  # noqa: PLR2004
+            self._count_cache.clear()
+        self._count_cache[key] = (now + self._COUNT_TTL, total)
+        return list(rows), total
+
+    async def get_updated_at(self, item_id: int) -> datetime | None:
+        """
+        Fetch only the row's `updated_at` timestamp for ETag comparison.
+
+        Args:
+            item_id: Primary key of the row.
+
+        Returns:
+            The row's last modification time, or None when the row is absent.
+        """
+
+        return await self.session.scalar(
+            select(Chat.updated_at).where(Chat.id == item_id)
+        )
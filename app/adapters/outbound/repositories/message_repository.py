@@ -3,8 +3,16 @@ Database repository for Message model.
 Provides basic CRUD operations for user sessions.
 """
 
+import time
+from datetime import datetime
+from typing import ClassVar
+
+from advanced_alchemy.exceptions import NotFoundError
+from advanced_alchemy.filters import FilterTypes
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
-from personal_growth_sdk.multi_agent.models import Message
+from personal_growth_sdk.multi_agent.models import Chat, Message
+from sqlalchemy import select, true
+from sqlalchemy.orm import aliased
 
 __all__ = ['MessageRepository']
 
@@ -15,3 +23,122 @@ class MessageRepository(SQLAlchemyAsyncRepository[Message]):
     """
 
     model_type = Message  # Specifies the SQLAlchemy model class
+
+    _COUNT_TTL = 5.0
+    _count_cache: ClassVar[dict[str, tuple[float, int]]] = {}
+
+    async def list_keyset(
+            self,
+            cursor: int | None,
+            limit: int,
+    ) -> tuple[list[Message], int | None]:
+        """
+        Fetch one page of messages via keyset pagination.
+
+        Pages with an index range scan (`id < cursor ORDER BY id DESC`) instead
+        of LIMIT/OFFSET, so deep pages do not re-scan skipped rows and no
+        COUNT(*) is issued.
+
+        Args:
+            cursor: Last `id` seen on the previous page, or None for the first page.
+            limit: Maximum number of rows to return.
+
+        Returns:
+            Tuple of (rows, next_cursor); next_cursor is None on the last page.
+        """
+
+        stmt = select(Message).order_by(Message.id.desc()).limit(limit + 1)
+        if cursor is not None:
+            stmt = stmt.where(Message.id < cursor)
+
+        result = await self.session.execute(stmt)
+        rows = list(result.scalars())
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1].id
+        return rows, next_cursor
+
+    async def list_and_count_cached(self, *filters: FilterTypes) -> tuple[list[Message], int]:
+        """
+        List rows and return the total, reusing a recently computed COUNT.
+
+        The COUNT(*) half of `list_and_count` is invariant between page loads
+        of the same filtered listing, so its result is cached in-process for
+        `_COUNT_TTL` seconds keyed on the filters' repr. On a hit only the row
+        query is executed.
+
+        Args:
+            *filters: Filters to apply to the query.
+
+        Returns:
+            Tuple of (rows, total count).
+        """
+
+        key = repr(filters)
+        now = time.monotonic()
+        cached = self._count_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return await self.list(*filters), cached[1]
+
+        rows, total = await self.list_and_count(*filters)
+        if len(self._count_cache) >= 256:  # noqa: PLR2004
+            self._count_cache.clear()
+        self._count_cache[key] = (now + self._COUNT_TTL, total)
+        return list(rows), total
+
+    async def get_updated_at(self, item_id: int) -> datetime | None:
+        """
+        Fetch only the row's `updated_at` timestamp for ETag comparison.
+
+        Args:
+            item_id: Primary key of the row.
+
+        Returns:
+            The row's last modification time, or None when the row is absent.
+        """
+
+        return await self.session.scalar(
+            select(Message.updated_at).where(Message.id == item_id)
+        )
+
+    async def get_chat_with_tail(self, chat_id: int, tail: int) -> tuple[Chat, list[Message]]:
+        """
+        Fetch a chat and its most recent messages in one round-trip.
+
+        A LATERAL join pulls the chat row together with its newest `tail`
+        messages, fusing what would otherwise be separate chat and history
+        queries into a single statement.
+
+        Args:
+            chat_id: Chat to load.
+            tail: Maximum number of trailing messages to return.
+
+        Returns:
+            Tuple of (chat, messages) with messages newest first.
+
+        Raises:
+            NotFoundError: If the chat does not exist.
+        """
+
+        tail_lateral = (
+            select(Message)
+            .where(Message.chat_id == Chat.id)
+            .order_by(Message.id.desc())
+            .limit(tail)
+            .lateral()
+        )
+        tail_message = aliased(Message, tail_lateral)
+        stmt = (
+            select(Chat, tail_message)
+            .outerjoin(tail_message, true())
+            .where(Chat.id == chat_id)
+            .order_by(tail_message.id.desc())
+        )
+
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            raise NotFoundError(f'Chat {chat_id} not found')
+        messages = [message for _, message in rows if message is not None]
+        return rows[0][0], messages
@@ -1,4 +1,5 @@
 from .ai_agent_factory import AIAgentFactory
 from .ai_agent_interface import AIAgentGatewayInterface
+from .batching import AgentRequestBatcher, get_batcher
 
-__all__ = ['AIAgentFactory', 'AIAgentGatewayInterface']
+__all__ = ['AIAgentFactory', 'AIAgentGatewayInterface', 'AgentRequestBatcher', 'get_batcher']
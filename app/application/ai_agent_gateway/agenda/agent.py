@@ -29,8 +29,7 @@ class AgendaAgent(AIAgentGatewayInterface):
     name = 'agenda'
     agent_base_url = settings.app.AGENDA_SERVICE_URL
 
-    @classmethod
-    async def _get_health_status(cls) -> tuple[HealthStatus, dict | None]:
+    async def _get_health_status(self) -> tuple[HealthStatus, dict | None]:
         """
         Perform a basic GET /health request to the Agenda service.
 
@@ -40,15 +39,14 @@ class AgendaAgent(AIAgentGatewayInterface):
 
         await HttpService.raw_request(
             'GET',
-            f'{cls.agent_base_url}/health'
+            f'{self.agent_base_url}/health'
         )
 
         return HealthStatus.OK, None
 
-    @classmethod
     async def generate(
-            cls,
-            chat_id: int,  # noqa: ARG003
+            self,
+            chat_id: int,  # noqa: ARG002
             new_message: str
     ) -> str:
         """
@@ -5,16 +5,19 @@ Provides a singleton interface to retrieve, register, and health-check available
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+
+from personal_growth_sdk.lib.schemas.health_check_schema import (
+    DependencyHealth,
+    DependencyType,
+    HealthStatus,
+)
 
 from app.lib.errors.exceptions import UnsupportedAgentError
 from app.lib.singleton import SingletonMeta
 
 from .ai_agent_interface import AIAgentGatewayInterface
-from .utils import discover_agents
-
-if TYPE_CHECKING:
-    from personal_growth_sdk.lib.schemas.health_check_schema import DependencyHealth
+from .utils import discover_agent_modules, load_agents_from_module
 
 __all__ = ['AIAgentFactory']
 
@@ -23,12 +26,35 @@ class AIAgentFactory(metaclass=SingletonMeta):
     """
     Singleton factory and route_registry for AI agents.
 
-    Automatically discovers and registers all available agent backends.
+    Agent modules are discovered without importing them; a backend is imported
+    and instantiated only when first requested (or pinged), keeping process
+    start-up independent of how many backends are installed.
 
     Attributes:
         _agents: A dictionary mapping agent names to their instances.
+        _registry: A dictionary mapping candidate module names to import paths.
     """
-    _agents: dict[str, AIAgentGatewayInterface] = discover_agents()
+    _agents: dict[str, AIAgentGatewayInterface] = {}
+    _registry: dict[str, str] = discover_agent_modules()
+    _PING_TIMEOUT = 2.0
+
+    @classmethod
+    def _ensure_loaded(cls, module_name: str) -> None:
+        """
+        Import one discovered module and register the agents it defines.
+
+        Args:
+            module_name: Name of the module in `_registry` to load.
+        """
+        module_path = cls._registry.pop(module_name, None)
+        if module_path is not None:
+            cls._agents.update(load_agents_from_module(module_path))
+
+    @classmethod
+    def _load_all(cls) -> None:
+        """Import every remaining discovered module."""
+        for module_name in list(cls._registry):
+            cls._ensure_loaded(module_name)
 
     @classmethod
     async def ping_agents(
@@ -43,11 +69,41 @@ class AIAgentFactory(metaclass=SingletonMeta):
         Returns:
             List of DependencyHealth objects for each checked agent.
         """
-        results: list[DependencyHealth] = []
-        for name, agent_cls in cls._agents.items():
-            if (only is None) or (name in only):
-                results.append(await agent_cls.ping())
-        return results
+        cls._load_all()
+        targets = [
+            (name, agent)
+            for name, agent in cls._agents.items()
+            if (only is None) or (name in only)
+        ]
+        return list(await asyncio.gather(
+            *(cls._ping_bounded(name, agent) for name, agent in targets)
+        ))
+
+    @classmethod
+    async def _ping_bounded(cls, name: str, agent: AIAgentGatewayInterface) -> DependencyHealth:
+        """
+        Ping one agent with a hard deadline.
+
+        `ping` already converts backend failures into an ERROR record; this
+        wrapper only adds the timeout so one stalled agent cannot hold up the
+        whole health response.
+
+        Args:
+            name: Registered agent name.
+            agent: Agent to ping.
+
+        Returns:
+            The agent's DependencyHealth, or an ERROR record on timeout.
+        """
+        try:
+            return await asyncio.wait_for(agent.ping(), timeout=cls._PING_TIMEOUT)
+        except TimeoutError:
+            return DependencyHealth(
+                type=DependencyType.HTTP,
+                name=f'Agent: {name}',
+                status=HealthStatus.ERROR,
+                details={'error': f'ping timed out after {cls._PING_TIMEOUT}s'}
+            )
 
     @classmethod
     def get(cls, name: str) -> AIAgentGatewayInterface:
@@ -63,18 +119,21 @@ class AIAgentFactory(metaclass=SingletonMeta):
         Raises:
             UnsupportedAgentError: If the agent is not registered.
         """
+        key = name.lower()
+        if key not in cls._agents:
+            cls._ensure_loaded(key)
         try:
-            return cls._agents[name.lower()]
+            return cls._agents[key]
         except KeyError as exc:
             raise UnsupportedAgentError(name) from exc
 
     @classmethod
-    def register(cls, name: str, agent_cls: AIAgentGatewayInterface) -> None:
+    def register(cls, name: str, agent: AIAgentGatewayInterface) -> None:
         """
         Manually register an AI agent under a given name.
 
         Args:
             name: The name to register the agent under.
-            agent_cls: The agent instance to register.
+            agent: The agent instance to register.
         """
-        cls._agents[name.lower()] = agent_cls
+        cls._agents[name.lower()] = agent
@@ -3,11 +3,14 @@ Defines a common interface for AI agent backends.
 
 Each agent must inherit from `AIAgentGatewayInterface` and implement `generate()` and `_get_health_status()`.
 Ensures a consistent contract for message generation and health monitoring across all agents.
+Agents are instantiated once by the factory; per-instance state (semaphore,
+tuning knobs) lives on the instance so each backend can be tuned independently.
 """
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 from personal_growth_sdk.lib.schemas.health_check_schema import (
     DependencyHealth,
@@ -24,9 +27,19 @@ class AIAgentGatewayInterface(ABC):
 
     Attributes:
         name (str): Human-readable name of the agent (used in logs and health checks).
+        max_batch (int): Upper bound on requests coalesced into one batched call.
+        max_wait_ms (int): Collection window before a partial batch is flushed.
+        max_concurrency (int): Upper bound on simultaneous generate calls to the backend.
     """
 
     name: str | None = None
+    max_batch: ClassVar[int] = 8
+    max_wait_ms: ClassVar[int] = 10
+    max_concurrency: ClassVar[int] = 8
+
+    def __init__(self) -> None:
+        # Each instance owns its limiter so backends throttle independently.
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
 
     def __init_subclass__(cls, **kwargs):
         """
@@ -41,8 +54,7 @@ class AIAgentGatewayInterface(ABC):
             if getattr(cls, attr, None) in (None, ''):
                 raise TypeError(f'{cls.__name__}: attribute `{attr}` must be set.')
 
-    @classmethod
-    async def ping(cls) -> DependencyHealth:
+    async def ping(self) -> DependencyHealth:
         """
         Performs a health check for the current agent implementation.
 
@@ -51,12 +63,12 @@ class AIAgentGatewayInterface(ABC):
         """
         gateway_dependency = DependencyHealth(
             type=DependencyType.HTTP,
-            name=f'Agent: {cls.name}',
+            name=f'Agent: {self.name}',
             status=HealthStatus.OK,
             details=None
         )
         try:
-            status, details = await cls._get_health_status()
+            status, details = await self._get_health_status()
             gateway_dependency.status = status
             gateway_dependency.details = details
         except Exception as e:
@@ -65,9 +77,8 @@ class AIAgentGatewayInterface(ABC):
 
         return gateway_dependency
 
-    @classmethod
     @abstractmethod
-    async def _get_health_status(cls, **kwargs) -> tuple[HealthStatus, dict[str, Any] | None]:
+    async def _get_health_status(self, **kwargs) -> tuple[HealthStatus, dict[str, Any] | None]:
         """
         Checks the backend service's health status.
 
@@ -79,10 +90,9 @@ class AIAgentGatewayInterface(ABC):
         """
         pass
 
-    @classmethod
     @abstractmethod
     async def generate(
-            cls,
+            self,
             chat_id: int,
             new_message: str
     ) -> str:
@@ -99,3 +109,27 @@ class AIAgentGatewayInterface(ABC):
             The assistant's generated reply as a string.
         """
         pass
+
+    async def generate_batch(self, requests: list[tuple[int, str]]) -> list[str]:
+        """
+        Generate replies for a batch of coalesced requests.
+
+        The default implementation fans the batch out to `generate` concurrently,
+        bounded by the instance's `max_concurrency` semaphore so bursts cannot
+        trigger provider-side rate-limit storms; backends with a native batch
+        endpoint should override this to issue a single upstream call.
+
+        Args:
+            requests: `(chat_id, new_message)` pairs, in submission order.
+
+        Returns:
+            Replies in the same order as `requests`.
+        """
+
+        async def bounded(chat_id: int, message: str) -> str:
+            async with self._semaphore:
+                return await self.generate(chat_id=chat_id, new_message=message)
+
+        return list(await asyncio.gather(
+            *(bounded(chat_id, message) for chat_id, message in requests)
+        ))
@@ -0,0 +1,100 @@
+"""
+Asynchronous batching of agent generate calls.
+
+Concurrent `generate` requests to the same agent are coalesced into a single
+`generate_batch` call, amortizing per-call overhead (network RTT, provider
+minimum latency) across all in-flight users. Each waiter gets its own reply
+back through a future, so per-request latency stays close to direct submission.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ai_agent_interface import AIAgentGatewayInterface
+
+__all__ = ['AgentRequestBatcher', 'get_batcher']
+
+
+class AgentRequestBatcher:
+    """
+    Collects concurrent generate calls for one agent and flushes them as a batch.
+
+    A flush happens when `max_batch` requests are pending or `max_wait_ms` has
+    elapsed since the first one, whichever comes first. Both limits are read
+    from the agent class, so they can be tuned per backend.
+    """
+
+    def __init__(self, gateway: AIAgentGatewayInterface) -> None:
+        self._gateway = gateway
+        self._pending: list[tuple[int, str, asyncio.Future[str]]] = []
+        self._full = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+
+    async def submit(self, chat_id: int, new_message: str) -> str:
+        """
+        Enqueue one generate request and wait for its reply.
+
+        Args:
+            chat_id: Identifier for the conversation.
+            new_message: User message to respond to.
+
+        Returns:
+            The assistant's reply for this request.
+        """
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        self._pending.append((chat_id, new_message, future))
+        if len(self._pending) >= self._gateway.max_batch:
+            self._full.set()
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Wait for a full batch or the collection window, then flush it."""
+
+        try:
+            await asyncio.wait_for(self._full.wait(), timeout=self._gateway.max_wait_ms / 1000)
+        except TimeoutError:
+            pass
+        batch, self._pending = self._pending, []
+        self._full.clear()
+        self._flush_task = None
+
+        try:
+            replies = await self._gateway.generate_batch(
+                [(chat_id, message) for chat_id, message, _ in batch]
+            )
+        except Exception as exc:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, _, future), reply in zip(batch, replies, strict=True):
+            if not future.done():
+                future.set_result(reply)
+
+
+_batchers: dict[str, AgentRequestBatcher] = {}
+
+
+def get_batcher(gateway: AIAgentGatewayInterface) -> AgentRequestBatcher:
+    """
+    Return the shared batcher for an agent, creating it on first use.
+
+    Args:
+        gateway: Agent instance to batch requests for.
+
+    Returns:
+        The per-agent AgentRequestBatcher instance.
+    """
+
+    batcher = _batchers.get(gateway.name)
+    if batcher is None:
+        batcher = _batchers[gateway.name] = AgentRequestBatcher(gateway)
+    return batcher
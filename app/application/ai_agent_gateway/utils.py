@@ -1,6 +1,10 @@
 """
-Automatically discovers, imports, and instantiates AIAgentGatewayInterface subclasses
-from modules in this package.
+Discovers and lazily imports AIAgentGatewayInterface subclasses from modules in this package.
+
+Discovery is split in two phases so that backend modules — which may pull in
+heavy SDKs or read config on import — are only imported when an agent is
+actually requested: `discover_agent_modules` enumerates candidate modules
+without importing them, `load_agents_from_module` performs the import.
 """
 
 from __future__ import annotations
@@ -8,33 +12,63 @@ from __future__ import annotations
 import importlib
 import inspect
 import pkgutil
+import sys
+from functools import lru_cache
 
 from app.lib.logger import logger
 
 from .ai_agent_interface import AIAgentGatewayInterface
 
 
-def discover_agents() -> dict[str, AIAgentGatewayInterface]:
+@lru_cache(maxsize=1)
+def discover_agent_modules() -> dict[str, str]:
     """
-    Imports all agent modules and returns a dict of instantiated AIAgentGatewayInterface subclasses.
+    Enumerate agent modules in this package without importing them.
+
+    The pkgutil filesystem scan is memoized; repeated callers share the
+    result of the first walk.
+
+    Returns:
+        Mapping of module name to its dotted import path.
     """
 
-    agents: dict[str, AIAgentGatewayInterface] = {}
     package = '.'.join(__name__.split('.')[:-1])
-    for _, module_name, _ in pkgutil.iter_modules([package.replace('.', '/')]):
-        module_path = f'{package}.{module_name}'
-        try:
-            module = importlib.import_module(module_path)
-            if hasattr(module, '__all__'):
-                for cls_name in module.__all__:
-                    cls = getattr(module, cls_name, None)
-                    if (
-                            isinstance(cls, type)
-                            and issubclass(cls, AIAgentGatewayInterface)
-                            and not inspect.isabstract(cls)
-                    ):
-                        agents[cls().name] = cls()
-        except Exception as exc:
-            logger.critical(f'Failed to import module {module_path}: {exc}')
+    return {
+        module_name: f'{package}.{module_name}'
+        for _, module_name, _ in pkgutil.iter_modules([package.replace('.', '/')])
+    }
+
+
+def load_agents_from_module(module_path: str) -> dict[str, AIAgentGatewayInterface]:
+    """
+    Import one agent module and instantiate its AIAgentGatewayInterface subclasses.
+
+    Args:
+        module_path: Dotted import path of the module to load.
+
+    Returns:
+        Mapping of agent name to instance; empty when the import fails.
+    """
+
+    agents: dict[str, AIAgentGatewayInterface] = {}
+    interface = AIAgentGatewayInterface
+    is_abstract = inspect.isabstract
+    try:
+        # Already-imported modules skip the import-lock acquisition entirely.
+        module = sys.modules.get(module_path) or importlib.import_module(module_path)
+        module_dict = module.__dict__
+        for cls_name in module_dict.get('__all__', ()):
+            # Direct __dict__ access skips the descriptor protocol; the mro
+            # check replaces issubclass to bypass __subclasshook__.
+            cls = module_dict.get(cls_name)
+            if (
+                    type(cls) is type
+                    and interface in cls.__mro__
+                    and not is_abstract(cls)
+            ):
+                agent = cls()
+                agents[agent.name] = agent
+    except Exception as exc:
+        logger.critical(f'Failed to import module {module_path}: {exc}')
 
     return agents
@@ -3,6 +3,7 @@ from .auth_service import AuthService
 from .chat_service import ChatService
 from .health_service import HealthService
 from .message_service import MessageService
+from .semantic_cache import SemanticReplyCache
 from .snapshot_service import SnapshotService
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     'ChatService',
     'HealthService',
     'MessageService',
+    'SemanticReplyCache',
     'SnapshotService'
 ]
@@ -6,7 +6,7 @@ for controllers and use-cases to request AI-generated responses without
 depending on a specific implementation of an AI provider.
 """
 
-from app.application.ai_agent_gateway import AIAgentFactory, AIAgentGatewayInterface
+from app.application.ai_agent_gateway import AIAgentFactory, AIAgentGatewayInterface, get_batcher
 
 __all__ = ['AIService']
 
@@ -39,4 +39,4 @@ class AIService:
             AI-generated response text.
         """
 
-        return await self.gateway.generate(chat_id=chat_id, new_message=new_message)
+        return await get_batcher(self.gateway).submit(chat_id=chat_id, new_message=new_message)
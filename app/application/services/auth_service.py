@@ -14,20 +14,18 @@ Note:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from personal_growth_sdk.authorization.constants.authentication import AUTH_ACCESS_TOKEN_KEY
-from personal_growth_sdk.authorization.schemas import UserResponse
+import asyncio
+import hashlib
+import time
+from typing import ClassVar
 
 from app.config.base_settings import get_settings
 from app.lib.errors.exceptions import JWTAbsentException, JWTInvalidException
 from app.lib.http.http_service import HttpService
+from app.lib.schemas.authed_user_lite import AuthedUserLite
 from app.lib.security import PublicJWTManager
 from app.lib.singleton import SingletonMeta
 
-if TYPE_CHECKING:
-    from litestar import Request
-
 __all__ = ['AuthService']
 
 settings = get_settings()
@@ -40,6 +38,16 @@ class AuthService(metaclass=SingletonMeta):
     Exposes utility methods for validating tokens and fetching the authenticated user.
     """
 
+    # Bursty request storms re-introspect the same token; the upstream
+    # /users/me response is reused briefly per token hash.
+    _USER_CACHE_TTL = 10.0
+    _USER_CACHE_MAX = 10_000
+    _user_cache: ClassVar[dict[bytes, tuple[float, AuthedUserLite]]] = {}
+
+    # Single-flight map: concurrent introspections of one token share the
+    # outstanding upstream call instead of issuing duplicates.
+    _inflight: ClassVar[dict[bytes, asyncio.Future[AuthedUserLite]]] = {}
+
     def __init__(self, http_service: HttpService):
         self.http_service = http_service
 
@@ -54,38 +62,71 @@ class AuthService(metaclass=SingletonMeta):
         url = f'{settings.app.AUTH_SERVICE_URL}/api/health/ping'
         await self.http_service.make_request(url=url, method='GET')
 
-    async def get_authenticated_user(self, request: Request) -> UserResponse:
+    async def get_authenticated_user(self, token: str | None, cookie_header: str = '') -> AuthedUserLite:
         """
-        Retrieve the currently authenticated user based on access token in cookies.
+        Retrieve the currently authenticated user for an access token.
 
         Internally:
-        - Extracts token from cookies
-        - Validates token locally using PublicJWTManager
-        - Calls `/api/v1/users/me` from the Auth service to fetch full user info
+        - Validates the token locally using PublicJWTManager (cached per token)
+        - Calls `/api/v1/users/me` from the Auth service, decoding only the
+          `id`/`role` projection the gateway needs and reusing it for a short
+          TTL per token hash
 
         Args:
-            request: Incoming HTTP request (used to access cookies)
+            token: Access token value extracted from the request cookies.
+            cookie_header: Raw `Cookie` header to forward upstream verbatim,
+                avoiding a parse/re-serialize round trip.
 
         Returns:
-            Parsed `UserResponse` representing the authenticated user.
+            Parsed `AuthedUserLite` projection of the authenticated user.
 
         Raises:
             JWTAbsentException: If no token is provided
             JWTInvalidException: If the token is expired or malformed
         """
 
-        token = request.cookies.get(AUTH_ACCESS_TOKEN_KEY)
         if token is None:
             raise JWTAbsentException
 
+        # Cache check comes before signature verification: entries are only
+        # admitted with a TTL capped by the token's own `exp`, so a hit proves
+        # the token was valid and unexpired — the whole auth cost collapses to
+        # one hash plus a dict lookup for hot tokens.
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        now = time.monotonic()
+        entry = self._user_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
         try:
-            PublicJWTManager.decode_access_token(token)
+            payload = PublicJWTManager.decode_access_token(token)
         except Exception as exc:
             raise JWTInvalidException(details=str(exc)) from exc
 
-        return await self.http_service.make_json_request(
-            f'{settings.app.AUTH_SERVICE_URL}/api/v1/users/me',
-            method='GET',
-            cookies=request.cookies,
-            response_type=UserResponse,
-        )
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[AuthedUserLite] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            user = await self.http_service.make_json_request(
+                f'{settings.app.AUTH_SERVICE_URL}/api/v1/users/me',
+                method='GET',
+                headers={'Cookie': cookie_header},
+                response_type=AuthedUserLite,
+            )
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved for waiters that got cancelled
+            raise
+        else:
+            future.set_result(user)
+            ttl = min(self._USER_CACHE_TTL, payload.exp - time.time())
+            if ttl > 0:
+                if len(self._user_cache) >= self._USER_CACHE_MAX:
+                    self._user_cache.clear()
+                self._user_cache[key] = (now + ttl, user)
+            return user
+        finally:
+            self._inflight.pop(key, None)
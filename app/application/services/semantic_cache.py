@@ -0,0 +1,80 @@
+"""
+In-process TTL cache for assistant replies.
+
+Repeated, semantically-duplicate prompts inside the same chat ("hello",
+"what can you do?") are the cheapest requests to serve: the LLM round-trip
+dominates exchange latency and its answer rarely changes within a short
+window. Replies are cached per `(chat_id, normalized prompt)` so duplicate
+turns skip the model call entirely while still persisting both messages.
+"""
+
+from __future__ import annotations
+
+import time
+
+from app.lib.logger import logger
+
+__all__ = ['SemanticReplyCache']
+
+
+class SemanticReplyCache:
+    """
+    Bounded TTL cache mapping normalized prompts to assistant replies.
+
+    Keys include the chat id so replies never leak across conversations, and
+    a caller-supplied version (e.g. the id of the newest message) so entries
+    invalidate when the chat history advances. Entries also expire after
+    `ttl` seconds.
+    """
+
+    def __init__(self, ttl: float = 86400.0, max_entries: int = 1024) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: dict[tuple[int, int, str], tuple[float, str]] = {}
+
+    @staticmethod
+    def _normalize(prompt: str) -> str:
+        """Collapse whitespace and case so trivial variants share one entry."""
+
+        return ' '.join(prompt.casefold().split())
+
+    def get(self, chat_id: int, prompt: str, version: int = 0) -> str | None:
+        """
+        Return the cached reply for a prompt, or None on miss/expiry.
+
+        Args:
+            chat_id: Chat the prompt belongs to.
+            prompt: Raw user prompt.
+            version: Snapshot of the chat history the reply was produced under.
+
+        Returns:
+            The cached assistant reply, or None.
+        """
+
+        key = (chat_id, version, self._normalize(prompt))
+        entry = self._entries.get(key)
+        if entry is None:
+            logger.debug('Semantic cache miss', chat_id=chat_id)
+            return None
+        expires_at, reply = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            logger.debug('Semantic cache miss', chat_id=chat_id)
+            return None
+        logger.debug('Semantic cache hit', chat_id=chat_id)
+        return reply
+
+    def put(self, chat_id: int, prompt: str, reply: str, version: int = 0) -> None:
+        """
+        Store a reply for a prompt, evicting the oldest entry when full.
+
+        Args:
+            chat_id: Chat the prompt belongs to.
+            prompt: Raw user prompt.
+            reply: Assistant reply to cache.
+            version: Snapshot of the chat history the reply was produced under.
+        """
+
+        if len(self._entries) >= self._max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[(chat_id, version, self._normalize(prompt))] = (time.monotonic() + self._ttl, reply)
@@ -8,6 +8,9 @@ to ensure the chat experience remains uninterrupted.
 
 from __future__ import annotations
 
+import asyncio
+from typing import ClassVar
+
 from app.config.base_settings import get_settings
 from app.lib.http.http_service import HttpService
 from app.lib.logger import logger
@@ -29,6 +32,11 @@ class SnapshotService(metaclass=SingletonMeta):
     Failures are non-critical and are logged without affecting flow.
     """
 
+    # Captures run off the request path; the task set is bounded so a slow
+    # snapshot backend cannot accumulate unbounded background work.
+    _MAX_BACKGROUND_TASKS = 100
+    _background_tasks: ClassVar[set[asyncio.Task]] = set()
+
     def __init__(self, http_service: HttpService):
         self.http_service = http_service
 
@@ -45,7 +53,28 @@ class SnapshotService(metaclass=SingletonMeta):
 
     async def capture(self, user_id: int, message: str) -> None:
         """
-        Submit a user message for analysis (emotion, intent, etc.).
+        Schedule a user message for analysis (emotion, intent, etc.).
+
+        The HTTP call is dispatched as a fire-and-forget background task so the
+        chat exchange never blocks on snapshot latency. When the bounded task
+        set is full the capture is dropped with a warning.
+
+        Args:
+            user_id: ID of the user who sent the message
+            message: The actual message content to analyze
+        """
+
+        if len(self._background_tasks) >= self._MAX_BACKGROUND_TASKS:
+            logger.warning('Snapshot capture skipped: background task limit reached')
+            return
+
+        task = asyncio.create_task(self._capture_now(user_id=user_id, message=message))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _capture_now(self, user_id: int, message: str) -> None:
+        """
+        Perform the actual snapshot submission.
 
         If the snapshot service is unreachable or fails, the exception is caught
         and logged — the main application flow is not interrupted.
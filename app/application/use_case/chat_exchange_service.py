@@ -7,13 +7,15 @@ combining snapshot capturing, message persistence, and LLM-based response genera
 
 from __future__ import annotations
 
+import asyncio
+
 from personal_growth_sdk.multi_agent.models.enums import ChatRole
 from personal_growth_sdk.multi_agent.schemas import (
     MessageCreateRequest,
     MessageResponse,
 )
 
-from app.application.services import MessageService, SnapshotService
+from app.application.services import MessageService, SemanticReplyCache, SnapshotService
 from app.infrastructure.di.providers import provide_ai_service
 
 __all__ = ['ChatExchangeService']
@@ -25,8 +27,16 @@ class ChatExchangeService:
 
     Combines message persistence, snapshot capture, and AI-driven reply generation.
     Used by controller layers to coordinate user input and assistant output.
+
+    Duplicate prompts within a chat are answered from a shared reply cache,
+    skipping the LLM round-trip — the dominant latency of the exchange.
     """
 
+    _reply_cache = SemanticReplyCache()
+
+    # Number of trailing messages pulled alongside the chat row in one query.
+    _HISTORY_TAIL = 20
+
     def __init__(
             self,
             message_service: MessageService,
@@ -34,6 +44,8 @@ class ChatExchangeService:
     ) -> None:
         self.message_service = message_service
         self.snapshot_service = snapshot_service
+        # Cached facade; binding once makes each exchange a pure attribute load.
+        self.ai_service = provide_ai_service(agent_name='agenda')
 
     async def exchange(
             self,
@@ -43,9 +55,9 @@ class ChatExchangeService:
     ) -> list[MessageResponse]:
         """
         Perform the message exchange workflow:
-        - Save snapshot of the user and input message.
-        - Create the user message.
-        - Generate assistant reply using an AI agent.
+        - Load the chat and its recent history in a single round-trip.
+        - Schedule a snapshot of the user and input message (non-blocking).
+        - Create the user message while generating the assistant reply.
         - Create the assistant message.
         - Return both messages as MessageResponse objects.
 
@@ -58,20 +70,36 @@ class ChatExchangeService:
             Sequence containing the user message and the assistant's reply.
         """
 
+        _chat, history = await self.message_service.repository.get_chat_with_tail(
+            chat_id=chat_id,
+            tail=self._HISTORY_TAIL,
+        )
+        last_seen_id = history[0].id if history else 0
+
         await self.snapshot_service.capture(user_id=user_id, message=message)
-        ai_service = provide_ai_service(agent_name='agenda')
 
-        user_msg = await self.message_service.create(
-            MessageCreateRequest(
+        async def resolve_reply() -> str:
+            cached = self._reply_cache.get(chat_id, message, version=last_seen_id)
+            if cached is not None:
+                return cached
+            reply = await self.ai_service.generate_reply(
                 chat_id=chat_id,
-                role=ChatRole.USER,
-                content=message,
+                new_message=message,
             )
-        )
-
-        assistant_text = await ai_service.generate_reply(
-            chat_id=chat_id,
-            new_message=message,
+            self._reply_cache.put(chat_id, message, reply, version=last_seen_id)
+            return reply
+
+        # The user-message insert and the AI call are independent I/O waits;
+        # overlapping them hides the (cheap) insert behind generation latency.
+        user_msg, assistant_text = await asyncio.gather(
+            self.message_service.create(
+                MessageCreateRequest(
+                    chat_id=chat_id,
+                    role=ChatRole.USER,
+                    content=message,
+                )
+            ),
+            resolve_reply(),
         )
 
         assistant_msg = await self.message_service.create(
@@ -9,12 +9,40 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import msgspec
 from litestar.data_extractors import RequestExtractorField, ResponseExtractorField
-from litestar.serialization import decode_json, encode_json
+from litestar.serialization import default_serializer
 from litestar.utils.module_loader import module_to_os_path
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+# Prebuilt codecs for the engine/JSONB paths: reusing one Encoder/Decoder pair
+# skips litestar's wrapper indirection on every (de)serialized column while
+# keeping its default hook for non-native types.
+_json_encoder = msgspec.json.Encoder(enc_hook=default_serializer)
+_json_decoder = msgspec.json.Decoder()
+
+
+@lru_cache(maxsize=1)
+def _load_project_metadata() -> tuple[str, str] | None:
+    """
+    Read (name, version) from pyproject.toml once per process.
+
+    Memoized so rebuilding Settings (e.g. after a cache clear in tests) does
+    not repeat the blocking file read and TOML parse.
+
+    Returns:
+        (name, version) tuple, or None when no pyproject.toml is present.
+    """
+
+    from app.lib.utils.pyproject import PyProject, decode
+    try:
+        with open(f'{os.curdir}/pyproject.toml') as file:
+            content: PyProject = decode(file.read())
+    except FileNotFoundError:
+        return None
+    return content.tool['poetry']['name'], content.tool['poetry']['version']
+
 __all__ = ['get_settings']
 
 
@@ -64,8 +92,8 @@ class PostgresSettings:
         engine = create_async_engine(
             url=self.DSN,
             future=True,
-            json_serializer=encode_json,
-            json_deserializer=decode_json,
+            json_serializer=_json_encoder.encode,
+            json_deserializer=_json_decoder.decode,
             # isolation_level='AUTOCOMMIT',
             max_overflow=self.POOL_MAX_OVERFLOW,
             pool_size=self.POOL_SIZE,
@@ -81,10 +109,10 @@ class PostgresSettings:
             """
 
             def encoder(bin_value: bytes) -> bytes:
-                return b'\x01' + encode_json(bin_value)
+                return b'\x01' + _json_encoder.encode(bin_value)
 
             def decoder(bin_value: bytes) -> Any:
-                return decode_json(bin_value[1:])
+                return _json_decoder.decode(bin_value[1:])
 
             dbapi_connection.await_(
                 dbapi_connection.driver_connection.set_type_codec(
@@ -159,12 +187,10 @@ class AppSettings:
         if self.MODE not in {'PROD', 'STAGE', 'DEV', 'TEST'}:
             raise ValueError(f'Invalid MODE: {self.MODE}. Must be one of `PROD`, `STAGE`, `DEV`, `TEST`.')
 
-        # Load from pyproject.toml if exists
-        with open(f'{os.curdir}/pyproject.toml') as file:
-            from app.lib.utils.pyproject import PyProject, decode
-            content: PyProject = decode(file.read())
-            self.NAME = content.tool['poetry']['name']
-            self.VERSION = content.tool['poetry']['version']
+        # Load from pyproject.toml if exists (parsed once per process)
+        metadata = _load_project_metadata()
+        if metadata is not None:
+            self.NAME, self.VERSION = metadata
 
 
 @dataclass
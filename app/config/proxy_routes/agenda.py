@@ -8,13 +8,10 @@ This module configures:
 Used by the `RouteRegistry` to determine where and how to forward Agenda-related requests.
 """
 
-from app.config.base_settings import get_settings
-from app.config.route_registry import route_registry
-
-settings = get_settings()
+from app.config.route_registry import SETTINGS, route_registry
 
 route_registry.register(
     prefix='/api/v1/agenda',
     strip_url=r'/agenda',
-    upstream_base=settings.app.AGENDA_SERVICE_URL
+    upstream_base=SETTINGS.AGENDA_SERVICE_URL
 )
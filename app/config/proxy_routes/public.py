@@ -8,13 +8,10 @@ This includes:
 - Session login/refresh endpoints
 """
 
-from app.config.base_settings import get_settings
 from app.config.route_registry import route_registry
 
-settings = get_settings()
-
 # Public documentation and schema paths
-for p in ('/docs', '/openapi.json', '/docs/openapi.json'):
+for p in ('/docs', '/docs/*', '/openapi.json'):
     route_registry.add_public('*', p)
 
 # Unauthenticated session and health routes
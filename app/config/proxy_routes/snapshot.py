@@ -7,12 +7,9 @@ This module configures:
 Allows requests targeting /api/v1/snapshot to be proxied to the corresponding backend.
 """
 
-from app.config.base_settings import get_settings
-from app.config.route_registry import route_registry
-
-settings = get_settings()
+from app.config.route_registry import SETTINGS, route_registry
 
 route_registry.register(
     prefix='/api/v1/snapshot',
-    upstream_base=settings.app.SNAPSHOT_SERVICE_URL
+    upstream_base=SETTINGS.SNAPSHOT_SERVICE_URL
 )
@@ -12,7 +12,7 @@ This will import and register all proxy route declarations via `load_all()`.
 
 from __future__ import annotations
 
-from functools import lru_cache
+from app.config.base_settings import get_settings
 
 from .core import HTTPMethod, RewriteRule, RouteRegistry
 from .loader import load_all
@@ -20,17 +20,30 @@ from .loader import load_all
 # Singleton instance of RouteRegistry used across the application
 route_registry = RouteRegistry()
 
+# App-level settings resolved once for all proxy route declarations, so each
+# module reads upstream URLs from one shared object instead of re-calling
+# get_settings() at import.
+SETTINGS = get_settings().app
+
+
+_initialized = False
+
 
-# Load all proxy route declarations on import
-@lru_cache(maxsize=1)
 def init_route_registry() -> None:
     """
     Initialize the global proxy route registry once.
 
-    This function uses LRU cache to ensure it's executed only once,
-    regardless of how many times it's called.
+    Repeat calls are no-ops guarded by a plain module flag; callers all run
+    on the event loop, so no lock is needed, unlike the lru_cache wrapper
+    this replaces.
     """
+
+    global _initialized  # noqa: PLW0603
+    if _initialized:
+        return
     load_all()
+    route_registry.compile()
+    _initialized = True
 
 
-__all__ = ['HTTPMethod', 'RewriteRule', 'RouteRegistry', 'init_route_registry', 'route_registry']
+__all__ = ['SETTINGS', 'HTTPMethod', 'RewriteRule', 'RouteRegistry', 'init_route_registry', 'route_registry']
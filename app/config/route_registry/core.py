@@ -13,17 +13,19 @@ proxied, rewritten, or passed to local controllers.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
-from app.lib.singleton import SingletonMeta
-
 if TYPE_CHECKING:
     from re import Pattern
 
 __all__ = ['HTTPMethod', 'RewriteRule', 'RouteRegistry']
 
+# Sentinel key marking a trie node that terminates a registered prefix.
+_SVC_KEY = '__svc__'
+
 
 class HTTPMethod(StrEnum):
     """
@@ -44,8 +46,10 @@ class HTTPMethod(StrEnum):
         """
         Normalize a string to an HTTPMethod enum.
 
-        Accepts any case-insensitive string (e.g., 'get', 'POST').
-        Returns '*' as-is.
+        Accepts upper- or lower-case method strings (e.g., 'get', 'POST')
+        and '*'. Members are singletons, so callers compare the result with
+        `is`; rule matching below relies on that and must not regress to
+        `==`, which would fall back to str comparison.
 
         Args:
             value: HTTP method string.
@@ -57,104 +61,116 @@ class HTTPMethod(StrEnum):
             ValueError: If the method is unsupported.
         """
 
-        if value == '*':
-            return cls.ANY
         try:
-            return cls[value.upper()]
+            return _METHOD_TABLE[value]
         except KeyError as exc:
             raise ValueError(f'Unsupported HTTP method: {value}') from exc
 
 
+# Precomputed lookup so normalize() is a single dict hit instead of an
+# .upper() allocation per call; it runs once per rule per proxied request.
+_METHOD_TABLE = (
+        {m.value: m for m in HTTPMethod}
+        | {m.value.lower(): m for m in HTTPMethod}
+)
+
+
 # ------------------------------------------------------------------ #
 #  Re-write rules                                                    #
 # ------------------------------------------------------------------ #
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True, eq=False)
 class RewriteRule:
     """
     Rule for rewriting request paths based on method and regex match.
+
+    Rules live in lists and are never hashed or compared, so the generated
+    __eq__ and the frozen __setattr__ guard are skipped; slots plus
+    convention keep them effectively immutable.
     """
 
     method: HTTPMethod
     pattern: Pattern[str]
     replace: str
 
-    def matches(self, method: str, tail: str) -> bool:
+    def matches(self, method: HTTPMethod, tail: str) -> bool:
         """
         Determine whether the rule matches a given method and path tail.
 
         Args:
-            method: HTTP method.
+            method: Already-normalized HTTP method.
             tail: Remaining part of the path after the prefix.
 
         Returns:
             True if the rule matches, else False.
         """
 
-        m = HTTPMethod.normalize(method)
-        return (self.method is HTTPMethod.ANY or self.method is m) and self.pattern.match(tail)
-
-
-# ------------------------------------------------------------------ #
-#  Public (unauthenticated) routes                                   #
-# ------------------------------------------------------------------ #
-@dataclass(frozen=True, slots=True)
-class PublicRoute:
-    """
-    Route definition that does not require authentication.
-    """
-
-    method: HTTPMethod
-    prefix: str
-
-    def allows(self, method: str, path: str) -> bool:
-        """
-        Check if the given method and path match this public route.
-
-        Args:
-            method: HTTP method.
-            path: Full request path.
-
-        Returns:
-            True if route is publicly accessible.
-        """
-
-        m = HTTPMethod.normalize(method)
-        return (self.method is HTTPMethod.ANY or self.method is m) and (
-                path == self.prefix or path.startswith(self.prefix.rstrip('*'))
-        )
+        return (self.method is HTTPMethod.ANY or self.method is method) and self.pattern.match(tail)
 
 
 @dataclass(slots=True)
 class ServiceRoutes:
     """
     Container for proxy rules and rewrite options for an upstream service.
+
+    Rules are folded at construction into one alternation regex per method
+    (each rule wrapped in a named group), so matching a request tail is a
+    single C-level regex call instead of a Python loop over patterns. Rule
+    patterns must not contain named groups of their own.
     """
 
     upstream_base: str
     rules: list[RewriteRule] = field(default_factory=list)
-    strip_url: str | Pattern[str] | None = None
-
-    def rewrite_tail(self, method: str, tail: str) -> tuple[str, bool]:
+    strip_url: Pattern[str] | None = None
+    _combined: dict[HTTPMethod, tuple[Pattern[str], tuple[str, ...]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        any_rules = [r for r in self.rules if r.method is HTTPMethod.ANY]
+        if any_rules:
+            self._combined[HTTPMethod.ANY] = self._combine(any_rules)
+        for m in {r.method for r in self.rules} - {HTTPMethod.ANY}:
+            # Declaration order is kept, so first-rule-wins survives the
+            # merge: alternation matches the leftmost viable branch.
+            self._combined[m] = self._combine(
+                [r for r in self.rules if r.method is m or r.method is HTTPMethod.ANY]
+            )
+
+    @staticmethod
+    def _combine(rules: list[RewriteRule]) -> tuple[Pattern[str], tuple[str, ...]]:
+        """Merge rule patterns into one named-group alternation."""
+
+        pattern = re.compile('|'.join(f'(?P<r{i}>{r.pattern.pattern})' for i, r in enumerate(rules)))
+        return pattern, tuple(r.replace for r in rules)
+
+    def rewrite_tail(self, method: HTTPMethod, tail: str) -> tuple[str, bool]:
         """
         Apply rewrite rules to the tail of the request path.
 
         Args:
-            method: HTTP method.
+            method: Already-normalized HTTP method.
             tail: Path after the service prefix.
 
         Returns:
             A tuple of (new path, match flag).
         """
 
-        for rule in self.rules:
-            if rule.matches(method, tail):
-                return rule.replace, True
-        return tail, False
+        entry = self._combined.get(method) or self._combined.get(HTTPMethod.ANY)
+        if entry is None:
+            return tail, False
+        pattern, replacements = entry
+        match = pattern.match(tail)
+        if match is None:
+            return tail, False
+        return replacements[int(match.lastgroup[1:])], True
 
     def rewrite_upstream(self, path: str) -> str:
         """
         Strip prefix from path before forwarding to upstream.
 
+        `strip_url` is normalized to a compiled pattern at registration, so
+        this is a single sub() call with no per-request type dispatch.
+
         Args:
             path: Full request path.
 
@@ -162,35 +178,71 @@ class ServiceRoutes:
             Modified path with prefix removed if applicable.
         """
 
-        if not self.strip_url:
+        if self.strip_url is None:
             return path
 
-        if isinstance(self.strip_url, str):
-            return path.replace(self.strip_url, '', 1)
-
         # compiled re-pattern - remove exactly one match
         return self.strip_url.sub('', path, count=1)
 
 
-class RouteRegistry(metaclass=SingletonMeta):
+class RouteRegistry:
     """
-    Singleton route_registry of proxy routes and public access rules.
+    Registry of proxy routes and public access rules.
+
+    The application-wide singleton lives in the package `__init__`; there is
+    no metaclass guard, so attribute storage can use slots and per-request
+    loads index a C array instead of hashing into `__dict__`. `resolve` and
+    `resolve_url` are slot attributes holding the current implementations,
+    which lets `compile()` swap in the specialized versions without a
+    dispatch branch on the hot path.
     """
 
+    __slots__ = (
+        '_prefix_trie',
+        '_public_exact',
+        '_public_prefix',
+        '_public_prefix_re',
+        '_services',
+        'resolve',
+        'resolve_url',
+    )
+
     def __init__(self) -> None:
+        self.resolve = self._resolve_generic
+        self.resolve_url = self._resolve_url_generic
         self._services: dict[str, ServiceRoutes] = {}
-        self._public: list[PublicRoute] = []
+        # Public routes indexed per method: a set of exact paths for O(1)
+        # hits on the common case, plus one escaped-alternation regex per
+        # method over the '*'-suffixed entries, so the wildcard fallback is
+        # a single C-level scan regardless of how many prefixes exist.
+        self._public_exact: dict[HTTPMethod, set[str]] = {}
+        self._public_prefix: dict[HTTPMethod, tuple[str, ...]] = {}
+        self._public_prefix_re: dict[HTTPMethod, Pattern[str]] = {}
+        # Path-segment trie over registered prefixes: resolve() walks the
+        # request path segment by segment, so lookup cost tracks path depth
+        # instead of the number of registered services.
+        self._prefix_trie: dict = {}
 
     def add_public(self, method: str, path: str) -> None:
         """
         Register a public route that does not require authentication.
 
+        Paths ending in '*' match any route under the stripped prefix;
+        all other paths must match exactly.
+
         Args:
             method: HTTP method (e.g. 'GET', 'POST', '*').
             path: Path or prefix to mark as public.
         """
 
-        self._public.append(PublicRoute(HTTPMethod.normalize(method), path))
+        m = HTTPMethod.normalize(method)
+        if path.endswith('*'):
+            prefixes = (*self._public_prefix.get(m, ()), path.rstrip('*'))
+            self._public_prefix[m] = prefixes
+            # Rebuilt per registration, which only happens at startup.
+            self._public_prefix_re[m] = re.compile('|'.join(re.escape(p) for p in prefixes))
+        else:
+            self._public_exact.setdefault(m, set()).add(path)
 
     def is_public(self, method: str | HTTPMethod, path: str) -> bool:
         """
@@ -204,7 +256,15 @@ class RouteRegistry(metaclass=SingletonMeta):
             True if the route is public.
         """
 
-        return any(r.allows(method, path) for r in self._public)
+        m = HTTPMethod.normalize(method)
+        exact = self._public_exact
+        if path in exact.get(m, ()) or path in exact.get(HTTPMethod.ANY, ()):
+            return True
+        for key in (m, HTTPMethod.ANY):
+            pattern = self._public_prefix_re.get(key)
+            if pattern is not None and pattern.match(path) is not None:
+                return True
+        return False
 
     def register(
             self,
@@ -228,9 +288,93 @@ class RouteRegistry(metaclass=SingletonMeta):
 
         if prefix in self._services:
             raise ValueError(f'Prefix {prefix} already registered')
-        self._services[prefix] = ServiceRoutes(upstream_base, rules or [], strip_url)
+        # Normalized once so joining with a path tail never produces '//'.
+        upstream_base = upstream_base.rstrip('/')
+        if isinstance(strip_url, str):
+            strip_url = re.compile(re.escape(strip_url))
+        svc = ServiceRoutes(upstream_base, rules or [], strip_url)
+        self._services[prefix] = svc
+
+        node = self._prefix_trie
+        for segment in prefix.strip('/').split('/'):
+            node = node.setdefault(segment, {})
+        node[_SVC_KEY] = (len(prefix), svc)
+
+    def compile(self) -> None:
+        """
+        Specialize `resolve` into straight-line code for the registered table.
 
-    def resolve(self, method: str, path: str) -> tuple[str | None, str | None]:
+        Once all services are registered, the generic trie walk is replaced
+        by generated source that hardcodes each prefix check, rewrite-rule
+        dispatch and strip pattern, bound to this instance. Compiled
+        patterns and upstream URLs are injected as globals; CPython's
+        inline caches then see one flat function with no table lookups.
+        """
+
+        glb: dict = {}
+        services = sorted(self._services.items(), key=lambda kv: -len(kv[0]))
+
+        def emit(name: str, joined: bool) -> list[str]:
+            """Emit one specialized function; `joined` pre-joins the URL."""
+
+            lines = [f'def {name}(self, method, path):']
+            # Longest prefix first preserves longest-prefix-match semantics.
+            for i, (prefix, svc) in enumerate(services):
+                base = f'_BASE{i}'
+                glb[base] = svc.upstream_base
+                plen = len(prefix)
+                # Segment-aligned match, as with the trie: the prefix must
+                # end the path or be followed by '/'.
+                lines.append(
+                    f'    if path.startswith({prefix!r}) and (len(path) == {plen} or path[{plen}] == \'/\'):'
+                )
+                if svc.rules:
+                    lines.append(f'        tail = path[{plen}:]')
+                    combined = svc._combined
+                    first = True
+                    buckets = [*(k for k in combined if k is not HTTPMethod.ANY)]
+                    if HTTPMethod.ANY in combined:
+                        buckets.append(HTTPMethod.ANY)
+                    for m in buckets:
+                        is_any = m is HTTPMethod.ANY
+                        tag = 'ANY' if is_any else m.value
+                        pat, repl = f'_PAT{i}_{tag}', f'_REPL{i}_{tag}'
+                        glb[pat], glb[repl] = combined[m]
+                        if joined:
+                            # Rewrite targets pre-joined with the base URL.
+                            repl = f'_URL{i}_{tag}'
+                            glb[repl] = tuple(svc.upstream_base + r for r in combined[m][1])
+                        if is_any:
+                            indent = '        ' if first else '            '
+                            if not first:
+                                lines.append('        else:')
+                        else:
+                            indent = '            '
+                            lines.append(f"        {'if' if first else 'elif'} method == {m.value!r}:")
+                            first = False
+                        result = f'{repl}[int(m.lastgroup[1:])]' if joined \
+                            else f'{base}, {repl}[int(m.lastgroup[1:])]'
+                        lines.append(f'{indent}m = {pat}.match(tail)')
+                        lines.append(f'{indent}if m is not None:')
+                        lines.append(f'{indent}    return {result}')
+                if svc.strip_url is not None:
+                    strip = f'_STRIP{i}'
+                    glb[strip] = svc.strip_url
+                    stripped = f"{strip}.sub('', path, 1)"
+                    lines.append(f'        return {base} + {stripped}' if joined
+                                 else f'        return {base}, {stripped}')
+                else:
+                    lines.append(f'        return {base} + path' if joined else f'        return {base}, path')
+            lines.append('    return None' if joined else '    return None, None')
+            return lines
+
+        ns: dict = {}
+        exec('\n'.join(emit('resolve', joined=False)), glb, ns)  # noqa: S102
+        exec('\n'.join(emit('resolve_url', joined=True)), glb, ns)  # noqa: S102
+        self.resolve = ns['resolve'].__get__(self)
+        self.resolve_url = ns['resolve_url'].__get__(self)
+
+    def _resolve_generic(self, method: str, path: str) -> tuple[str | None, str | None]:
         """
         Resolve a request to its upstream target and modified path.
 
@@ -238,18 +382,58 @@ class RouteRegistry(metaclass=SingletonMeta):
             method: HTTP method.
             path: Request path.
 
+        The longest registered prefix wins: descent remembers the deepest
+        trie node carrying a service, so nested prefixes resolve correctly.
+
         Returns:
             Tuple of (upstream URL, rewritten path) or (None, None) if not matched.
         """
 
-        for prefix, svc in self._services.items():
-            if path.startswith(prefix):
-                tail = path[len(prefix):]
-                new_tail, matched = svc.rewrite_tail(method, tail)
-                path = svc.rewrite_upstream(path)
-                if matched:
-                    return svc.upstream_base, new_tail
+        # Normalized once here; rule matching below compares enum identity.
+        m = HTTPMethod.normalize(method)
+        node = self._prefix_trie
+        best: tuple[int, ServiceRoutes] | None = node.get(_SVC_KEY)
+        for segment in path.strip('/').split('/'):
+            node = node.get(segment)
+            if node is None:
+                break
+            hit = node.get(_SVC_KEY)
+            if hit is not None:
+                best = hit
+
+        if best is None:
+            return None, None
+
+        prefix_len, svc = best
+        tail = path[prefix_len:]
+        # Services without rules or strip_url (the common case) fall through
+        # without entering either rewrite method.
+        if svc.rules:
+            new_tail, matched = svc.rewrite_tail(m, tail)
+            if matched:
+                return svc.upstream_base, new_tail
+
+        if svc.strip_url is not None:
+            path = svc.rewrite_upstream(path)
+        return svc.upstream_base, path
+
+    def _resolve_url_generic(self, method: str, path: str) -> str | None:
+        """
+        Resolve a request straight to its full upstream URL.
+
+        Single-return variant of `resolve` for the proxy hot path: callers
+        get the joined URL (or None) without unpacking a tuple. compile()
+        emits a specialized version with rewrite targets pre-joined.
 
-                return svc.upstream_base, path
+        Args:
+            method: HTTP method.
+            path: Request path.
+
+        Returns:
+            Full upstream URL, or None if no service matched.
+        """
 
-        return None, None
+        upstream, tail = self.resolve(method, path)
+        if upstream is None:
+            return None
+        return upstream + tail
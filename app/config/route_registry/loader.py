@@ -1,38 +1,28 @@
 """
-Dynamic module importer for proxy route definitions.
+Explicit importer for proxy route definitions.
 
-This utility scans the `app.config.proxy_routes` package and ensures
-each file is imported exactly once. This triggers execution of their
-`route_registry.register()` calls and loads all declared proxy routes.
+Importing `app.config.proxy_routes.*` executes each module's
+`route_registry.register()` / `add_public()` calls exactly once (repeat
+imports are no-ops via `sys.modules`). The modules are listed explicitly
+instead of discovered with `pkgutil`: there are only a handful, the import
+order is deterministic, no filesystem scan happens at startup, and static
+analyzers see the dependency graph.
 
 Intended to be used at application startup, before the middleware
 depends on any registered routing logic.
 """
 
-from importlib import import_module
-from pathlib import Path
-from pkgutil import iter_modules
-
-PKG = 'app.config.proxy_routes'
-
 
 def load_all() -> None:
     """
-    Import every `.py` module in the `proxy_routes` package.
-
-    This ensures all route registrations are executed during app startup.
-    Skips private (`_`) and compiled (`.pyc`) files.
+    Import every proxy route module, executing its registrations.
 
-    Example:
-        >>> load_all()
-        # Automatically imports:
-        # - app.config.proxy_routes.auth
-        # - app.config.proxy_routes.agenda
-        # - ...
+    New route modules must be added to the import list below.
     """
 
-    package_dir = Path(import_module(PKG).__file__).parent
-    for mod in iter_modules([str(package_dir)]):
-        if mod.name.startswith('_'):
-            continue  # skip private / compiled
-        import_module(f'{PKG}.{mod.name}')
+    from app.config.proxy_routes import (  # noqa: F401, PLC0415
+        agenda,
+        auth,
+        public,
+        snapshot,
+    )
@@ -2,13 +2,15 @@ from .ai_dependencies import provide_ai_service
 from .auth_dependencies import provide_authenticate_service
 from .chat_dependencies import provide_chat_service
 from .chat_exchange_dependencies import provide_chat_exchange_service
-from .gateway_state import gateway_state_provider
+from .gateway_state import GW_STATE_DEPS, GW_STATE_PROVIDE, gateway_state_provider
 from .health_dependencies import provide_health_service
 from .message_dependencies import provide_message_service
 from .role_dependency import role_required
 from .snapshot_dependencies import provide_snapshot_service
 
 __all__ = [
+    'GW_STATE_DEPS',
+    'GW_STATE_PROVIDE',
     'gateway_state_provider',
     'provide_ai_service',
     'provide_authenticate_service',
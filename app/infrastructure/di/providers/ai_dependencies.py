@@ -6,16 +6,23 @@ Creates and returns an AIService instance configured with the specified agent.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from app.application.services import AIService
 
 __all__ = ['provide_ai_service']
 
 
+@lru_cache(maxsize=None)
 def provide_ai_service(
         agent_name: str,
 ) -> AIService:
     """
-    Provides an instance of AIService configured with the given agent.
+    Provides the AIService instance configured with the given agent.
+
+    AIService is a stateless facade over classmethod-based gateways, so one
+    instance per agent is cached and reused across requests instead of being
+    allocated per call.
 
     Args:
         agent_name: The name of the agent to be used by the service.
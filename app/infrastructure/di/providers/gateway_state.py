@@ -4,9 +4,12 @@ Extracts authenticated user context from the incoming request.
 """
 
 from litestar import Request
+from litestar.di import Provide
 
 from app.lib.context import GatewayState, gather_state
 
+__all__ = ['GW_STATE_DEPS', 'GW_STATE_PROVIDE', 'gateway_state_provider']
+
 
 def gateway_state_provider(request: Request) -> GatewayState:
     """
@@ -20,3 +23,9 @@ def gateway_state_provider(request: Request) -> GatewayState:
     """
 
     return gather_state(request)
+
+
+# Shared across controllers so Litestar builds a single dependency graph
+# instead of validating a fresh `Provide` per controller registration.
+GW_STATE_PROVIDE = Provide(gateway_state_provider, sync_to_thread=False)
+GW_STATE_DEPS = {'gw_state': GW_STATE_PROVIDE}
@@ -7,6 +7,7 @@ from personal_growth_sdk.authorization.models.enums import RoleType
 
 from app.lib.context import GatewayState
 from app.lib.errors.exceptions import UserAccessDeniedException
+from app.lib.security import role_bit, role_mask
 
 __all__ = ['role_required']
 
@@ -15,6 +16,9 @@ def role_required(allowed_roles: tuple[RoleType, ...]):
     """
     Creates dependency that enforces role-based access control.
 
+    The allowed roles are folded into a bitmask when the dependency is built,
+    so the per-request check is a single AND + compare instead of a tuple scan.
+
     Args:
         allowed_roles: Tuple of permitted roles
 
@@ -22,11 +26,13 @@ def role_required(allowed_roles: tuple[RoleType, ...]):
         Dependency that validates user roles at runtime
     """
 
+    required_mask = role_mask(allowed_roles)
+
     async def wrapper(
             gw_state: GatewayState
     ) -> None:
         user = gw_state.auth_user
-        if user is None or user.role not in allowed_roles:
+        if user is None or not (role_bit(user.role) & required_mask):
             raise UserAccessDeniedException
 
     return wrapper
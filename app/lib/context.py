@@ -18,7 +18,8 @@ from litestar import Request
 from litestar.datastructures import Cookie
 from litestar.types import Scope
 from msgspec import Struct
-from personal_growth_sdk.authorization.schemas import UserResponse
+
+from app.lib.schemas.authed_user_lite import AuthedUserLite
 
 __all__ = [
     'GatewayState',
@@ -31,10 +32,27 @@ __all__ = [
     'set_user',
 ]
 
-_USER_KEY = 'auth_user'
-_RESP_KEY = 'upstream_raw'
-_COOKIE_KEY = 'upstream_cookies'
-_HDR_KEY = 'upstream_headers'
+_GW_KEY = 'gw'
+
+
+class _GWSlot:
+    """
+    Mutable per-request slot the middlewares write into.
+
+    One slotted object under ``scope['state']['gw']`` replaces the four
+    separate string-keyed entries, so each read/write is an attribute access
+    instead of a dict hash.
+    """
+
+    __slots__ = ('cookies', 'gathered', 'headers', 'raw', 'user')
+
+    def __init__(self) -> None:
+        self.user: AuthedUserLite | None = None
+        self.raw: bytes | None = None
+        self.cookies: list[Cookie] | None = None
+        self.headers: dict[str, str] | None = None
+        # Filled on first gather_state() call; later injections reuse it.
+        self.gathered: GatewayState | None = None
 
 
 class GatewayState(Struct, frozen=True):
@@ -42,39 +60,49 @@ class GatewayState(Struct, frozen=True):
     Everything middleware saved into ``scope.state`` for a request.
     """
 
-    auth_user: UserResponse | None = None
+    auth_user: AuthedUserLite | None = None
     upstream_raw: bytes | None = None
     upstream_cookies: list[Cookie] | None = None
     upstream_headers: dict[str, str] | None = None
 
 
-def _state(scope: Scope) -> Scope:
+def _slot(scope: Scope) -> _GWSlot:
     """
-    Internal helper to access or create the `scope.state` dictionary.
+    Internal helper to access or create the request's gateway slot.
 
     Args:
         scope: ASGI request scope.
 
     Returns:
-        Mutable dictionary representing the request-local state.
+        Mutable slot object holding gateway request-local state.
     """
 
-    return scope.setdefault('state', {})
+    state = scope.setdefault('state', {})
+    slot = state.get(_GW_KEY)
+    if slot is None:
+        slot = state[_GW_KEY] = _GWSlot()
+    return slot
+
 
+def _request_slot(request) -> _GWSlot | None:
+    """Read the gateway slot from a request, if middleware created one."""
 
-def set_user(scope: Scope, user: UserResponse) -> None:
+    return request.state.get(_GW_KEY)
+
+
+def set_user(scope: Scope, user: AuthedUserLite) -> None:
     """
     Stores the authenticated user object into the request state.
 
     Args:
         scope: ASGI request scope.
-        user: Authenticated user information.
+        user: Authenticated user projection.
     """
 
-    _state(scope)[_USER_KEY] = user
+    _slot(scope).user = user
 
 
-def get_user(request) -> UserResponse | None:
+def get_user(request) -> AuthedUserLite | None:
     """
     Retrieves the authenticated user from request state.
 
@@ -82,10 +110,11 @@ def get_user(request) -> UserResponse | None:
         request: Incoming request object.
 
     Returns:
-        UserResponse if available, else None.
+        AuthedUserLite if available, else None.
     """
 
-    return request.state.get(_USER_KEY)
+    slot = _request_slot(request)
+    return slot.user if slot is not None else None
 
 
 def set_upstream(scope: Scope, raw: bytes) -> None:
@@ -97,7 +126,7 @@ def set_upstream(scope: Scope, raw: bytes) -> None:
         raw: Response content in bytes.
     """
 
-    _state(scope)[_RESP_KEY] = raw
+    _slot(scope).raw = raw
 
 
 def get_upstream(request: Request) -> bytes:
@@ -111,7 +140,8 @@ def get_upstream(request: Request) -> bytes:
         Raw response content.
     """
 
-    return request.state.get(_RESP_KEY)
+    slot = _request_slot(request)
+    return slot.raw if slot is not None else None
 
 
 def set_cookies(scope: Scope, cookies: list[Cookie]) -> None:
@@ -123,7 +153,7 @@ def set_cookies(scope: Scope, cookies: list[Cookie]) -> None:
         cookies: List of `Cookie` instances.
     """
 
-    _state(scope)[_COOKIE_KEY] = cookies
+    _slot(scope).cookies = cookies
 
 
 def get_cookies(request: Request) -> list[Cookie]:
@@ -137,7 +167,8 @@ def get_cookies(request: Request) -> list[Cookie]:
         List of `Cookie` instances or empty list.
     """
 
-    return request.state.get(_COOKIE_KEY)
+    slot = _request_slot(request)
+    return slot.cookies if slot is not None else None
 
 
 def set_headers(scope: Scope, hdrs: dict[str, str]) -> None:
@@ -149,7 +180,7 @@ def set_headers(scope: Scope, hdrs: dict[str, str]) -> None:
         hdrs: Dictionary of headers.
     """
 
-    _state(scope)[_HDR_KEY] = hdrs
+    _slot(scope).headers = hdrs
 
 
 def get_headers(request: Request) -> dict[str, str] | None:
@@ -162,13 +193,18 @@ def get_headers(request: Request) -> dict[str, str] | None:
     Returns:
         Dictionary of headers or None.
     """
-    return request.state.get(_HDR_KEY)
+    slot = _request_slot(request)
+    return slot.headers if slot is not None else None
 
 
 def gather_state(request) -> GatewayState:
     """
     Aggregates all proxy-related request state into an immutable data object.
 
+    The snapshot is built once per request and memoized on the slot: all
+    middlewares run before dependency resolution, so repeated injections
+    (guard dependency plus handler parameter) can safely share it.
+
     Args:
         request: Incoming request object.
 
@@ -176,9 +212,13 @@ def gather_state(request) -> GatewayState:
         GatewayState: Consolidated snapshot of all request metadata from middleware.
     """
 
-    return GatewayState(
-        auth_user=get_user(request),
-        upstream_raw=get_upstream(request),
-        upstream_cookies=get_cookies(request),
-        upstream_headers=get_headers(request),
-    )
+    slot = _slot(request.scope)
+    gathered = slot.gathered
+    if gathered is None:
+        gathered = slot.gathered = GatewayState(
+            auth_user=slot.user,
+            upstream_raw=slot.raw,
+            upstream_cookies=slot.cookies,
+            upstream_headers=slot.headers,
+        )
+    return gathered
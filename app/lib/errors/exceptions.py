@@ -41,10 +41,24 @@ __all__ = [  # noqa:  RUF022
 class AppException(Exception):  # noqa: N818 - сохранено для обратной совместимости
     """
     Base exception class for application errors.
+
+    Every subclass gets its class name cached in `_type_name`, so error
+    handlers read one class attribute instead of calling
+    `type(exception).__name__` per response.
     """
 
-    def __init__(self, message: str = '', details: Any = None) -> None:
-        self.message = message
+    _type_name = 'AppException'
+    message: str = ''
+    status_code: int = HTTP_500_INTERNAL_SERVER_ERROR
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._type_name = cls.__name__
+
+    def __init__(self, message: str | None = None, details: Any = None) -> None:
+        # Falls back to the class-level default via ordinary attribute lookup;
+        # no getattr-with-default on the raise path.
+        self.message = message or self.message
         self.details = details
         super().__init__(self.message)
 
@@ -52,10 +66,6 @@ class AppException(Exception):  # noqa: N818 - сохранено для обр
 class InitializationError(AppException):
     """Raised when a class or another cannot be configured in lifespan."""
 
-    def __init__(self, message: str | None = None, details: Any = None):
-        message = message or getattr(self, 'message', '')
-        super().__init__(message=message, details=details)
-
 
 # Authentication/Authorization Exceptions
 class JWTException(AppException):
@@ -65,10 +75,6 @@ class JWTException(AppException):
 
     status_code = HTTP_500_INTERNAL_SERVER_ERROR
 
-    def __init__(self, message: str | None = None, details: Any = None):
-        message = message or getattr(self, 'message', '')
-        super().__init__(message=message, details=details)
-
 
 class JWTAbsentException(JWTException):
     """
@@ -114,10 +120,6 @@ class UserException(AppException):
     status_code = HTTP_400_BAD_REQUEST
     message = 'Ошибка пользователя'
 
-    def __init__(self, message: str | None = None, details: Any = None):
-        message = message or getattr(self, 'message', '')
-        super().__init__(message=message, details=details)
-
 
 class UserAccessDeniedException(UserException):
     """
@@ -137,10 +139,6 @@ class HttpServiceException(AppException):
     status_code: int = HTTP_400_BAD_REQUEST
     message: str = 'HTTP Service Error'
 
-    def __init__(self, message: str | None = None, details: Any = None):
-        message = message or getattr(self, 'message', '')
-        super().__init__(message=message, details=details)
-
 
 class HttpRequestTimeoutError(HttpServiceException):
     """
@@ -185,5 +183,4 @@ class UnsupportedAgentError(AIAgentError):
     """
 
     def __init__(self, message: str | None = None, details: Any = None):
-        message = message or getattr(self, 'message', '')
-        super().__init__(message=f'Gateway `{message}` is not supported.', details=details)
+        super().__init__(message=f'Gateway `{message or self.message}` is not supported.', details=details)
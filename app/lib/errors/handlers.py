@@ -1,8 +1,16 @@
 """
 Exception handlers for different error types.
 Provides consistent error responses across the application.
+
+All handlers share one `ErrorBody` struct and one msgspec encoder, so the
+error path serializes in C instead of building a dict per response and
+routing it through the generic serializer — which matters under fault
+storms, when this path runs for every request.
 """
 
+from types import MappingProxyType
+from typing import Any
+
 import advanced_alchemy.exceptions
 import msgspec
 from litestar import Request, Response
@@ -18,71 +26,69 @@ from app.lib.errors.exceptions import HttpServiceException
 settings = get_settings()
 
 
-def get_error_details(exception):
+class ErrorBody(msgspec.Struct):
     """
-    Returns error details only in non-production environments.
+    Wire shape shared by every error response.
     """
 
-    return exception.details if settings.app.MODE != 'PROD' or settings.app.DEBUG else None
+    type: str
+    message: str
+    details: Any = None
 
 
-def default_exception_handler(request: Request, exception: HTTPException) -> Response:  # noqa: ARG001
+_ERR_ENCODER = msgspec.json.Encoder()
+
+
+def _error_response(type_name: str, status_code: int, message: str, details: Any = None) -> Response:
     """
-    Default handler for HTTP exceptions.
+    Build the JSON error response for an exception.
+
+    Args:
+        type_name: Exception class name reported as `type`.
+        status_code: HTTP status for the response.
+        message: Human-readable error message.
+        details: Optional diagnostic payload.
+
+    Returns:
+        Response with the pre-encoded error body.
     """
 
     return Response(
-        status_code=exception.status_code,
-        content={
-            'type': type(exception).__name__,
-            'message': 'Bad client_info',
-            'details': exception.detail,
-        }
+        status_code=status_code,
+        content=_ERR_ENCODER.encode(ErrorBody(type=type_name, message=message, details=details)),
+        media_type='application/json',
     )
 
 
-def http_service_exception_handler(request, exception: HttpServiceException) -> Response:  # noqa: ARG001
+def get_error_details(exception):
     """
-    Handler for http requests errors.
+    Returns error details only in non-production environments.
     """
 
-    return Response(
-        status_code=exception.status_code,
-        content={
-            'type': type(exception).__name__,
-            'message': exception.message,
-            'details': get_error_details(exception),
-        }
-    )
+    return exception.details if settings.app.MODE != 'PROD' or settings.app.DEBUG else None
 
 
-def jwt_exception_handler(request: Request, exception: JWTException) -> Response:  # noqa: ARG001
+def default_exception_handler(request: Request, exception: HTTPException) -> Response:  # noqa: ARG001
     """
-    Handler for JWT authentication errors.
+    Default handler for HTTP exceptions.
     """
 
-    return Response(
-        status_code=exception.status_code,
-        content={
-            'type': type(exception).__name__,
-            'message': exception.message,
-            'details': get_error_details(exception),
-        }
-    )
+    return _error_response(type(exception).__name__, exception.status_code, 'Bad client_info', exception.detail)
 
 
-def user_exception_handler(request: Request, exception: UserException) -> Response:  # noqa: ARG001
+def service_exception_handler(
+        request: Request,  # noqa: ARG001
+        exception: HttpServiceException | JWTException | UserException
+) -> Response:
     """
-    Handler for user-related errors.
+    Shared handler for app exceptions that carry their own status code.
     """
 
-    return Response(
-        status_code=exception.status_code,
-        content={
-            'type': type(exception).__name__,
-            'message': exception.message,
-            'details': get_error_details(exception),
-        }
+    return _error_response(
+        exception._type_name,  # noqa: SLF001
+        exception.status_code,
+        exception.message,
+        get_error_details(exception)
     )
 
 
@@ -91,14 +97,7 @@ def app_exception_handler(request: Request, exception: AppException) -> Response
     Fallback handler for custom AppExceptions.
     """
 
-    return Response(
-        status_code=500,
-        content={
-            'type': type(exception).__name__,
-            'message': exception.message,
-            'details': get_error_details(exception),
-        }
-    )
+    return _error_response(exception._type_name, 500, exception.message, get_error_details(exception))  # noqa: SLF001
 
 
 def validation_exception_handler(request: Request, exception: ValidationException) -> Response:  # noqa: ARG001
@@ -106,14 +105,7 @@ def validation_exception_handler(request: Request, exception: ValidationExceptio
     Handler for request validation errors.
     """
 
-    return Response(
-        status_code=400,
-        content={
-            'type': type(exception).__name__,
-            'message': exception.detail,
-            'details': exception.extra
-        }
-    )
+    return _error_response(type(exception).__name__, 400, exception.detail, exception.extra)
 
 
 def msgspec_validation_exception_handler(
@@ -124,14 +116,7 @@ def msgspec_validation_exception_handler(
     Handler for msgspec validation errors.
     """
 
-    return Response(
-        status_code=400,
-        content={
-            'type': type(exception).__name__,
-            'message': exception.__str__(),
-            'details': None,
-        }
-    )
+    return _error_response(type(exception).__name__, 400, str(exception))
 
 
 def advanced_alchemy_exception_handler(
@@ -142,14 +127,7 @@ def advanced_alchemy_exception_handler(
     Handler for database repository errors.
     """
 
-    return Response(
-        status_code=500,
-        content={
-            'type': type(exception).__name__,
-            'message': 'Internal server error',
-            'details': None,
-        }
-    )
+    return _error_response(type(exception).__name__, 500, 'Internal server error')
 
 
 def litestar_not_found_exception_handler(request: Request, exception: NotFoundException) -> Response:  # noqa: ARG001
@@ -157,29 +135,27 @@ def litestar_not_found_exception_handler(request: Request, exception: NotFoundEx
     Handler for 404 Not Found errors.
     """
 
-    return Response(
-        status_code=404,
-        content={
-            'type': type(exception).__name__,
-            'message': exception.detail,
-            'details': None
-        }
-    )
+    return _error_response(type(exception).__name__, 404, exception.detail)
+
+
+# Built once at import: the table is read-only after startup, and the mapping
+# proxy keeps accidental mutation out while preserving plain dict lookups.
+EXCEPTION_HANDLERS = MappingProxyType({
+    ValidationException: validation_exception_handler,
+    HTTPException: default_exception_handler,
+    msgspec.ValidationError: msgspec_validation_exception_handler,
+    advanced_alchemy.exceptions.RepositoryError: advanced_alchemy_exception_handler,
+    NotFoundException: litestar_not_found_exception_handler,
+    HttpServiceException: service_exception_handler,
+    JWTException: service_exception_handler,
+    UserException: service_exception_handler,
+    AppException: app_exception_handler,
+})
 
 
 def collect_exception_handlers():
     """
-    Collects all exception handlers into a single mapping.
+    Returns the module-level exception handler mapping.
     """
 
-    return {
-        ValidationException: validation_exception_handler,
-        HTTPException: default_exception_handler,
-        msgspec.ValidationError: msgspec_validation_exception_handler,
-        advanced_alchemy.exceptions.RepositoryError: advanced_alchemy_exception_handler,
-        NotFoundException: litestar_not_found_exception_handler,
-        HttpServiceException: http_service_exception_handler,
-        JWTException: jwt_exception_handler,
-        UserException: user_exception_handler,
-        AppException: app_exception_handler,
-    }
+    return EXCEPTION_HANDLERS
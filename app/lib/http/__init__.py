@@ -1,3 +1,4 @@
+from .etag import make_etag
 from .http_service import HttpService
 
-__all__ = ['HttpService']
+__all__ = ['HttpService', 'make_etag']
@@ -0,0 +1,37 @@
+"""
+ETag derivation for single-resource endpoints.
+
+Tags are computed from `(id, updated_at)` so a row's tag changes exactly when
+the row does, letting conditional GETs short-circuit to 304 without loading
+or serializing the full record.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from base64 import urlsafe_b64encode
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+__all__ = ['make_etag']
+
+
+def make_etag(resource_id: int, updated_at: datetime) -> str:
+    """
+    Compute a stable ETag for a resource version.
+
+    Args:
+        resource_id: Primary key of the resource.
+        updated_at: Last modification timestamp of the resource.
+
+    Returns:
+        Quoted, URL-safe tag string for the `ETag` header.
+    """
+
+    digest = hashlib.blake2b(
+        f'{resource_id}:{updated_at.timestamp()}'.encode(),
+        digest_size=12
+    ).digest()
+    return f'"{urlsafe_b64encode(digest).decode()}"'
@@ -7,7 +7,9 @@ response validation, retry mechanisms, and JSON parsing using `msgspec`.
 """
 
 import asyncio
-from collections.abc import Callable
+import random
+from collections.abc import AsyncIterable, Callable
+from contextlib import AbstractAsyncContextManager
 from typing import Any, Literal
 
 import httpx
@@ -20,6 +22,42 @@ from app.lib.singleton import SingletonMeta
 
 __all__ = ['HttpService']
 
+# Decoders are stateful objects that are expensive to build relative to small
+# payloads; one instance per response type is reused across all calls.
+_DECODER_CACHE: dict[type, msgspec.json.Decoder] = {}
+
+
+def _decoder_for(response_type: type) -> msgspec.json.Decoder:
+    """Return the shared decoder for a response type, building it once."""
+
+    decoder = _DECODER_CACHE.get(response_type)
+    if decoder is None:
+        decoder = _DECODER_CACHE[response_type] = msgspec.json.Decoder(response_type)
+    return decoder
+
+
+# JSON bodies are serialized here with msgspec rather than handed to httpx,
+# which would run them through stdlib json.dumps.
+_JSON_ENCODER = msgspec.json.Encoder()
+_JSON_CONTENT_TYPE = {'Content-Type': 'application/json'}
+
+# MessagePack transport for internal RPC: smaller payloads than JSON and a
+# faster encode/decode path, with the same cached-decoder discipline.
+_MSGPACK_DECODER_CACHE: dict[type, msgspec.msgpack.Decoder] = {}
+
+
+def _msgpack_decoder_for(response_type: type) -> msgspec.msgpack.Decoder:
+    """Return the shared MessagePack decoder for a response type, building it once."""
+
+    decoder = _MSGPACK_DECODER_CACHE.get(response_type)
+    if decoder is None:
+        decoder = _MSGPACK_DECODER_CACHE[response_type] = msgspec.msgpack.Decoder(response_type)
+    return decoder
+
+
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+_MSGPACK_HEADERS = {'Content-Type': 'application/msgpack', 'Accept': 'application/msgpack'}
+
 
 class HttpService(metaclass=SingletonMeta):
     """
@@ -33,7 +71,15 @@ class HttpService(metaclass=SingletonMeta):
     - Request timeout and retry logic
     """
 
-    _POOL_SIZE = 100
+    # Pool sizing for proxy duty: every gateway request rides this client, so
+    # the hard cap must absorb bursts while the keepalive pool keeps hot
+    # per-host connections warm between them.
+    _MAX_CONNECTIONS = 2048
+    _KEEPALIVE_CONNECTIONS = 512
+    _KEEPALIVE_EXPIRY = 60.0
+    # Total budget for the retry loop: once this much time has passed since
+    # the first attempt started, no further retries are scheduled.
+    _RETRY_DEADLINE = 5.0
     _client: httpx.AsyncClient | None = None
 
     @classmethod
@@ -42,15 +88,23 @@ class HttpService(metaclass=SingletonMeta):
         Initialize the underlying HTTP client with connection pool settings.
 
         Creates a shared `httpx.AsyncClient` instance used for all outbound requests.
+        HTTP/2 is enabled so concurrent proxy calls to the same upstream are
+        multiplexed over one persistent TCP+TLS connection instead of paying
+        handshake costs per request.
         Must be called before making any requests if no client is present.
         """
 
         if cls._client is None:
             cls._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0),
+                http2=True,
+                # Granular budgets: internal upstreams should connect fast
+                # and never queue long for a pooled connection, while reads
+                # keep the generous budget for slow ML-backed endpoints.
+                timeout=httpx.Timeout(connect=2.0, read=30.0, write=10.0, pool=1.0),
                 limits=httpx.Limits(
-                    max_connections=cls._POOL_SIZE,
-                    max_keepalive_connections=cls._POOL_SIZE
+                    max_connections=cls._MAX_CONNECTIONS,
+                    max_keepalive_connections=cls._KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=cls._KEEPALIVE_EXPIRY
                 )
             )
 
@@ -75,16 +129,26 @@ class HttpService(metaclass=SingletonMeta):
         Specifically converts all boolean values into lowercase string literals
         ('true' / 'false') to match common web API expectations.
 
+        The common case — no booleans at all — returns the input unchanged;
+        a copy is only built when something actually needs rewriting.
+
         Args:
             params: Original query parameters
 
         Returns:
-            A new dictionary with normalized parameter values.
+            The original mapping, or a copy with normalized values.
         """
 
+        if not params:
+            return {}
+        for value in params.values():
+            if value is True or value is False:
+                break
+        else:
+            return params
         return {
             key: 'true' if value is True else 'false' if value is False else value
-            for key, value in (params or {}).items()
+            for key, value in params.items()
         }
 
     @classmethod
@@ -125,11 +189,10 @@ class HttpService(metaclass=SingletonMeta):
             HttpRequestTimeoutError: On repeated timeouts
         """
 
+        decoder = _decoder_for(response_type)
+
         async def parse_response(response: httpx.Response) -> T | tuple[T, dict]:
-            decoded = msgspec.json.decode(
-                response.content,
-                type=response_type
-            )
+            decoded = decoder.decode(response.content)
             return (decoded, dict(response.cookies)) if include_cookies else decoded
 
         return await cls._execute_request(
@@ -143,6 +206,60 @@ class HttpService(metaclass=SingletonMeta):
             response_handler=parse_response
         )
 
+    @classmethod
+    async def make_msgpack_request[T](  # noqa: PLR0913
+            cls,
+            url: str,
+            method: Literal['GET', 'POST', 'PUT', 'PATCH', 'DELETE'],
+            response_type: type[T],
+            headers: dict | None = None,
+            cookies: dict | None = None,
+            params: dict | None = None,
+            body: Any = None,
+    ) -> T:
+        """
+        Send an HTTP request over MessagePack, for service-to-service calls.
+
+        The body is encoded with `msgspec.msgpack` and the response is decoded
+        with a cached `msgspec.msgpack.Decoder` — both ends must speak
+        `application/msgpack`, so this is only for internal upstreams that
+        advertise it; external traffic stays on `make_json_request`.
+
+        Args:
+            url: Endpoint URL
+            method: HTTP method
+            response_type: The expected type of the decoded response
+            headers: Optional request headers
+            cookies: Optional cookies
+            params: Query parameters
+            body: Request payload, MessagePack-encoded when not None
+
+        Returns:
+            Parsed response of type `T`
+
+        Raises:
+            HttpClientError: For 4xx responses
+            HttpServerError: For 5xx responses
+            HttpRequestTimeoutError: On repeated timeouts
+        """
+
+        decoder = _msgpack_decoder_for(response_type)
+
+        async def parse_response(response: httpx.Response) -> T:
+            return decoder.decode(response.content)
+
+        return await cls._execute_request(
+            url=url,
+            method=method,
+            headers={**_MSGPACK_HEADERS, **(headers or {})},
+            cookies=cookies,
+            params=params,
+            data=None,
+            json=None,
+            content=_MSGPACK_ENCODER.encode(body) if body is not None else None,
+            response_handler=parse_response
+        )
+
     @classmethod
     async def make_request(  # noqa: PLR0913
             cls,
@@ -199,7 +316,7 @@ class HttpService(metaclass=SingletonMeta):
             url: str,
             *,
             headers: list[tuple[bytes, bytes]] | None = None,
-            content: bytes | None = None,
+            content: bytes | AsyncIterable[bytes] | None = None,
             params: str | None = None,
     ) -> httpx.Response:
         """
@@ -229,6 +346,43 @@ class HttpService(metaclass=SingletonMeta):
             params=params,
         )
 
+    @classmethod
+    def stream_request(
+            cls,
+            method: str,
+            url: str,
+            *,
+            headers: list[tuple[bytes, bytes]] | None = None,
+            content: bytes | None = None,
+            params: str | None = None,
+    ) -> AbstractAsyncContextManager[httpx.Response]:
+        """
+        Open a streaming request, for large response bodies.
+
+        Unlike `raw_request`, the body is not buffered: the caller iterates
+        `response.aiter_bytes()` inside the returned context manager and each
+        chunk is released as soon as it is forwarded, so memory stays flat no
+        matter how large the upstream payload is.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST')
+            url: Fully qualified endpoint URL
+            headers: Byte-string headers list (httpx-style)
+            content: Raw request body
+            params: Encoded query string
+
+        Returns:
+            Async context manager yielding the streaming `httpx.Response`.
+        """
+
+        return cls._client.stream(
+            method=method,
+            url=url,
+            headers=headers,
+            content=content,
+            params=params,
+        )
+
     @classmethod
     async def _execute_request(  # noqa: PLR0913
             cls,
@@ -239,7 +393,8 @@ class HttpService(metaclass=SingletonMeta):
             params: dict | None,
             data: dict | None,
             json: dict | None,
-            response_handler: Callable[[httpx.Response], Any]
+            response_handler: Callable[[httpx.Response], Any],
+            content: bytes | None = None,
     ) -> Any:
         """
         Core request execution logic with retry mechanism.
@@ -251,6 +406,12 @@ class HttpService(metaclass=SingletonMeta):
         """
         params = cls._normalize_params(params)
 
+        if content is None and json is not None:
+            content = _JSON_ENCODER.encode(json)
+            headers = {**_JSON_CONTENT_TYPE, **(headers or {})}
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + cls._RETRY_DEADLINE
         for attempt in range(1, 4):
             try:
                 response = await cls._client.request(
@@ -260,21 +421,23 @@ class HttpService(metaclass=SingletonMeta):
                     cookies=cookies,
                     params=params,
                     data=data,
-                    json=json,
+                    content=content,
                 )
                 await cls._validate_response(response)
                 return await response_handler(response)
 
-            except TimeoutError as exc:
+            except httpx.TimeoutException as exc:
                 logger.warning(f'Request timeout (attempt {attempt}/3)')
-                if attempt == 3:  # noqa: PLR2004
+                # Jittered backoff bounded by a total deadline: retries never
+                # stall the coroutine past the budget, so tail latency stays
+                # bounded even when every attempt times out.
+                backoff = random.uniform(0.05, 0.2) * (2 ** (attempt - 1))  # noqa: S311
+                if attempt == 3 or loop.time() + backoff >= deadline:  # noqa: PLR2004
                     raise HttpRequestTimeoutError(details=exc) from exc
-                await asyncio.sleep(2 ** attempt)
+                await asyncio.sleep(backoff)
 
             except httpx.HTTPStatusError as e:
                 cls._map_http_error(e)
-            except Exception as exc:
-                raise exc
 
     @classmethod
     async def _validate_response(cls, response: httpx.Response) -> None:
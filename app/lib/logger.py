@@ -5,6 +5,7 @@ Configures structured logging with performance monitoring middleware.
 
 import logging
 
+import msgspec
 import structlog
 from litestar.logging import LoggingConfig, StructLoggingConfig
 from litestar.middleware.logging import LoggingMiddlewareConfig
@@ -32,6 +33,41 @@ def custom_log_processor(logger_instance, method_name, event_dict):  # noqa: ARG
     return event_dict
 
 
+# Processor chain assembled by log level: the callsite and stack-info
+# processors walk interpreter frames on every log call, which is useful while
+# debugging but pure overhead in production — they are only installed when the
+# configured level is DEBUG or lower.
+_processors = [
+    structlog.processors.TimeStamper(fmt='iso', utc=True),
+    structlog.processors.add_log_level,
+]
+
+if settings.log.LEVEL <= logging.DEBUG:
+    _processors += [
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.CallsiteParameterAdder([
+            structlog.processors.CallsiteParameter.FILENAME,
+            structlog.processors.CallsiteParameter.MODULE,
+            structlog.processors.CallsiteParameter.FUNC_NAME,
+            structlog.processors.CallsiteParameter.LINENO,
+        ]),
+    ]
+
+_processors.append(custom_log_processor)
+
+# JSON mode writes msgspec-encoded bytes straight to `sys.stdout.buffer`,
+# skipping the TextIOWrapper encode + `print` lock that PrintLogger pays per
+# call (the bytes logger appends the trailing newline itself). Console mode
+# keeps the str-based renderer and logger for human-readable output.
+if settings.log.JSON:
+    _processors.append(lambda logger_instance, method_name, event_dict: msgspec.json.encode(event_dict))  # noqa: ARG005
+    _logger_factory = structlog.BytesLoggerFactory()
+else:
+    _processors.append(structlog.dev.ConsoleRenderer(
+        colors=True, exception_formatter=RichTracebackFormatter(max_frames=1, show_locals=False, width=80)
+    ))
+    _logger_factory = structlog.PrintLoggerFactory()
+
 # Main logging configuration
 log = StructlogConfig(
     structlog_logging_config=StructLoggingConfig(
@@ -39,24 +75,8 @@ log = StructlogConfig(
         standard_lib_logging_config=LoggingConfig(
             root={'level': logging.getLevelName(settings.log.LEVEL)},
         ),
-        processors=[
-            structlog.processors.TimeStamper(fmt='iso'),
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.CallsiteParameterAdder([
-                structlog.processors.CallsiteParameter.FILENAME,
-                structlog.processors.CallsiteParameter.MODULE,
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-                structlog.processors.CallsiteParameter.LINENO,
-            ]),
-
-            custom_log_processor,
-
-            structlog.processors.JSONRenderer() if settings.log.JSON else structlog.dev.ConsoleRenderer(
-                colors=True, exception_formatter=RichTracebackFormatter(max_frames=1, show_locals=False, width=80)
-            )
-        ],
-        logger_factory=structlog.PrintLoggerFactory(),
+        processors=_processors,
+        logger_factory=_logger_factory,
     ),
     middleware_logging_config=LoggingMiddlewareConfig(
         request_log_fields=settings.log.REQUEST_FIELDS,
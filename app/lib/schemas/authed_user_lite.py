@@ -0,0 +1,27 @@
+"""
+Lite projection of the upstream user for the authentication hot path.
+
+Every guarded request introspects `/api/v1/users/me`, but the gateway itself
+only ever reads the user's id and role. Decoding into this projection skips
+parsing and allocating the rest of the upstream payload (profile fields,
+active sessions); endpoints that need the full profile decode `UserResponse`
+from the proxied body instead.
+"""
+
+import msgspec
+from personal_growth_sdk.authorization.models.enums import RoleType
+
+__all__ = ['AuthedUserLite']
+
+
+class AuthedUserLite(msgspec.Struct, frozen=True):
+    """
+    Minimal authenticated-user view carried in request state.
+
+    Attributes:
+        id: User ID
+        role: User's role, used for access-control checks
+    """
+
+    id: int
+    role: RoleType
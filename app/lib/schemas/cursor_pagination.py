@@ -0,0 +1,24 @@
+"""
+Keyset (cursor) pagination container.
+
+Used by list endpoints that page with `WHERE id < :cursor` range scans instead
+of LIMIT/OFFSET, so deep pages stay O(limit) and no COUNT(*) is issued.
+"""
+
+import msgspec
+
+
+class CursorPagination[T](msgspec.Struct):
+    """
+    One page of results fetched via keyset pagination.
+
+    Attributes:
+        items: Records on this page, newest first.
+        limit: Requested page size.
+        next_cursor: Id to pass as `cursor` for the next page, or None when
+            this is the last page.
+    """
+
+    items: list[T]
+    limit: int
+    next_cursor: int | None = None
@@ -0,0 +1,22 @@
+"""
+Request body schema for the chat exchange endpoint.
+
+The target chat is taken from the path, so the body carries only the message
+content — no duplicated `chat_id` field to validate against the path value.
+"""
+
+import msgspec
+
+
+class ExchangeRequest(msgspec.Struct, forbid_unknown_fields=True):
+    """
+    User message payload for `POST /messages/{chat_id}/exchange`.
+
+    Attributes:
+        content: Text content of the user's message.
+
+    Config:
+        forbid_unknown_fields: Rejects payloads with extra fields
+    """
+
+    content: str
@@ -2,34 +2,38 @@
 JWT Token payload schema definition.
 Defines the structure and validation rules for JWT token contents.
 """
-import contextlib
 import datetime
 
 import msgspec
 
 
-class TokenPayloadSchema(msgspec.Struct, forbid_unknown_fields=True):
+class TokenPayloadSchema(msgspec.Struct):
     """
     JWT token payload schema with validation rules.
 
+    `exp` stays the raw POSIX integer the token carries: comparisons against
+    `time.time()` need no datetime object, and decoding allocates nothing
+    beyond the struct. Unknown claims are ignored rather than rejected — the
+    signature already proves the payload's integrity, so policing extra keys
+    on every decode buys nothing.
+
     Attributes:
         sub: User ID (required)
-        exp: Expiration (datetime)
+        exp: Expiration as POSIX timestamp
         role: Optional role string
-
-    Config:
-        forbid_unknown_fields: Rejects payloads with extra fields
     """
 
     sub: str
-    exp: datetime.datetime | int
+    exp: int
     role: str | None
 
-    def __post_init__(self):
-        """
-        Post-initialization processing.
-        Automatically converts integer timestamps to UTC datetime objects if needed.
-        """
+    @property
+    def exp_dt(self) -> datetime.datetime:
+        """Expiration as an aware UTC datetime, materialized on demand."""
+
+        return datetime.datetime.fromtimestamp(self.exp, datetime.UTC)
+
 
-        with contextlib.suppress(TypeError, ValueError):
-            self.exp = datetime.datetime.fromtimestamp(int(self.exp), datetime.UTC)
+# Shared decoder for callers parsing raw payload bytes straight into the
+# struct, skipping the intermediate dict.
+token_payload_decoder = msgspec.json.Decoder(TokenPayloadSchema)
@@ -1,4 +1,4 @@
 from .jwt import PublicJWTManager
-from .role import RoleGroup
+from .role import RoleGroup, role_bit, role_mask
 
-__all__ = ['PublicJWTManager', 'RoleGroup']
+__all__ = ['PublicJWTManager', 'RoleGroup', 'role_bit', 'role_mask']
@@ -3,16 +3,52 @@ Role-based access control groups.
 Defines permission sets for different user roles.
 """
 
+from collections.abc import Iterable
 from typing import ClassVar
 
 from personal_growth_sdk.authorization.models.enums import RoleType
 
-__all__ = ['RoleGroup']
+__all__ = ['RoleGroup', 'role_bit', 'role_mask']
 
 from app.config.base_settings import get_settings
 
 settings = get_settings()
 
+# One bit per role, assigned once at import; membership checks collapse to a
+# single AND + compare instead of tuple iteration.
+_ROLE_BITS: dict[RoleType, int] = {role: 1 << index for index, role in enumerate(RoleType)}
+
+
+def role_bit(role: RoleType) -> int:
+    """
+    Return the bit assigned to a single role (0 for unknown roles).
+
+    Args:
+        role: Role to look up.
+
+    Returns:
+        Power-of-two bit for the role.
+    """
+
+    return _ROLE_BITS.get(role, 0)
+
+
+def role_mask(roles: Iterable[RoleType]) -> int:
+    """
+    Combine roles into a single bitmask.
+
+    Args:
+        roles: Roles to include in the mask.
+
+    Returns:
+        Bitwise OR of the roles' bits.
+    """
+
+    mask = 0
+    for role in roles:
+        mask |= role_bit(role)
+    return mask
+
 
 class RoleGroup:
     """
@@ -21,12 +57,13 @@ class RoleGroup:
 
     _is_prod_mode = settings.app.MODE == 'PROD'
 
-    _extra: ClassVar[tuple[RoleType, ...]] = () if _is_prod_mode else (RoleType.DEVELOPER,)
+    _extra: ClassVar[frozenset[RoleType]] = frozenset() if _is_prod_mode else frozenset({RoleType.DEVELOPER})
 
-    # Access groups
-    ADMIN: ClassVar[tuple[RoleType, ...]] = tuple({RoleType.ADMIN, *_extra})
-    STAFF: ClassVar[tuple[RoleType, ...]] = tuple({*ADMIN, RoleType.MANAGER, *_extra})
-    COMMON: ClassVar[tuple[RoleType, ...]] = tuple({*ADMIN, *STAFF, RoleType.USER, *_extra})
+    # Access groups, stored as frozensets so direct membership tests are O(1)
+    # hash lookups; role_required collapses them further into bitmasks.
+    ADMIN: ClassVar[frozenset[RoleType]] = frozenset({RoleType.ADMIN}) | _extra
+    STAFF: ClassVar[frozenset[RoleType]] = ADMIN | {RoleType.MANAGER}
+    COMMON: ClassVar[frozenset[RoleType]] = STAFF | {RoleType.USER}
 
     # Development-only roles
-    PRIVATE: ClassVar[tuple[RoleType, ...]] = _extra if not _is_prod_mode else ()
+    PRIVATE: ClassVar[frozenset[RoleType]] = _extra
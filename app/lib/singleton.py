@@ -27,6 +27,7 @@ class SingletonMeta(type):
             The singleton instance of the class.
         """
 
-        if cls not in cls._instances:
-            cls._instances[cls] = super(SingletonMeta, cls).__call__(*args, **kwargs)  # noqa: UP008
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is None:
+            instance = cls._instances[cls] = super(SingletonMeta, cls).__call__(*args, **kwargs)  # noqa: UP008
+        return instance
@@ -3,6 +3,7 @@ Manages core application lifecycle events.
 Handles startup/shutdown logging and hooks.
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -14,26 +15,15 @@ from app.config.route_registry import init_route_registry
 from app.lib.errors.exceptions import InitializationError
 from app.lib.http import HttpService
 from app.lib.logger import logger
+from app.server.middleware.logging import start_timing_log_drainer, stop_timing_log_drainer
 
 __all__ = ['provide_lifespan_service']
 
 settings = get_settings()
 
 
-@asynccontextmanager
-async def provide_lifespan_service(app: Litestar) -> AsyncGenerator[None, None]:
-    """
-    Main lifespan manager for application events.
-    """
-
-    await logger.ainfo('Initializing application resources')
-
-    try:
-        init_route_registry()
-        await logger.ainfo('Proxy route registry loaded')
-    except Exception as exc:
-        await logger.aerror('Failed to load proxy route registry: %s', str(exc))
-        raise InitializationError('Could not initialize route registry') from exc
+async def _init_http_service(app: Litestar) -> None:
+    """Initialize the shared HTTP client and expose it on app state."""
 
     try:
         new_http_service = HttpService()
@@ -44,18 +34,50 @@ async def provide_lifespan_service(app: Litestar) -> AsyncGenerator[None, None]:
         await logger.aerror('Failed to initialize HttpService: %s', str(exc))
         raise InitializationError('Could not initialize HttpService') from exc
 
+
+async def _init_agent_factory(app: Litestar) -> None:
+    """Initialize the AI gateway factory and warm every backend."""
+
     try:
         new_agent_factory = AIAgentFactory()
         app.state.gateways_factory = new_agent_factory
-        await logger.ainfo('AI Agent Factory initialized successfully')
+        # Warm-up: import every discovered backend and ping it once so the
+        # first user request doesn't pay module imports, DNS resolution or
+        # TCP/TLS pool establishment. Failing pings are only logged.
+        warmup_results = await new_agent_factory.ping_agents()
+        await logger.ainfo('AI Agent Factory initialized successfully (%d agents warmed)', len(warmup_results))
     except Exception as exc:
         await logger.aerror('Failed to initialize AI Agent Factory: %s', str(exc))
         raise InitializationError('Could not initialize AI Agent Factory') from exc
 
+
+@asynccontextmanager
+async def provide_lifespan_service(app: Litestar) -> AsyncGenerator[None, None]:
+    """
+    Main lifespan manager for application events.
+    """
+
+    await logger.ainfo('Initializing application resources')
+
+    try:
+        init_route_registry()
+        await logger.ainfo('Proxy route registry loaded')
+    except Exception as exc:
+        await logger.aerror('Failed to load proxy route registry: %s', str(exc))
+        raise InitializationError('Could not initialize route registry') from exc
+
+    # HTTP client setup and gateway warm-up are independent; overlapping them
+    # shortens cold-start by the smaller of the two wait times. The warm-up
+    # pings lazily initialize the shared client if they win the race.
+    await asyncio.gather(_init_http_service(app), _init_agent_factory(app))
+
+    start_timing_log_drainer()
+
     await logger.ainfo('Server is starting')
     try:
         yield
     finally:
         await logger.ainfo('Cleaning up application resources')
+        stop_timing_log_drainer()
         await HttpService.cleanup_resources()
         await logger.ainfo('Server is shutting down')
@@ -5,10 +5,12 @@ Intercepts all non-public routes to extract and validate the access token from c
 On success, attaches the authenticated user to the request scope for downstream access.
 """
 
-from litestar import Request
+import logging
+
 from litestar.enums import ScopeType
 from litestar.middleware import ASGIMiddleware
 from litestar.types import ASGIApp, Receive, Scope, Send
+from personal_growth_sdk.authorization.constants.authentication import AUTH_ACCESS_TOKEN_KEY
 
 from app.config.route_registry import route_registry
 from app.infrastructure.di.providers import provide_authenticate_service
@@ -16,8 +18,43 @@ from app.lib.context import set_user
 
 __all__ = ['AuthGuardMiddleware']
 
+from app.config.base_settings import get_settings
 from app.lib.logger import logger
 
+# Resolved once at import: when debug logging is off, the per-request trace
+# costs a single boolean check instead of a logger call with formatted args.
+_DEBUG = get_settings().log.LEVEL <= logging.DEBUG
+
+_COOKIE = b'cookie'
+
+
+def _extract_access_token(scope: Scope) -> tuple[str | None, str]:
+    """
+    Pull the access token straight out of the raw `Cookie` header(s).
+
+    One linear scan over `scope['headers']` and a split on the single cookie
+    header — no `Request` object, no full cookie jar. HTTP/2 clients may send
+    several `cookie` headers; they are joined per RFC 9113 §8.2.3.
+
+    Args:
+        scope: ASGI scope of the incoming request.
+
+    Returns:
+        Tuple of (access token value or None, raw cookie header string).
+    """
+
+    header = '; '.join(
+        value.decode('latin-1') for name, value in scope['headers'] if name.lower() == _COOKIE
+    )
+    if not header:
+        return None, ''
+
+    for part in header.split('; '):
+        key, sep, value = part.partition('=')
+        if sep and key.strip() == AUTH_ACCESS_TOKEN_KEY:
+            return value, header
+    return None, header
+
 
 class AuthGuardMiddleware(ASGIMiddleware):
     """
@@ -41,10 +78,10 @@ class AuthGuardMiddleware(ASGIMiddleware):
             await next_app(scope, receive, send)
             return
 
-        logger.debug('\n\nAuthGuardMiddleware\n\n')
-        request = Request(scope)
+        token, cookie_header = _extract_access_token(scope)
         auth_service = provide_authenticate_service()
-        user = await auth_service.get_authenticated_user(request)
+        user = await auth_service.get_authenticated_user(token, cookie_header)
         set_user(scope, user)
-        logger.debug('AuthGuard OK → user_id=%s path=%s', user.id, scope['path'])
+        if _DEBUG:
+            logger.debug('AuthGuard OK → user_id=%s path=%s', user.id, scope['path'])
         await next_app(scope, receive, send)
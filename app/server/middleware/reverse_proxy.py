@@ -11,9 +11,11 @@ state.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
+import logging
 from collections.abc import Iterable
-from http.cookies import Morsel, SimpleCookie
+from email.utils import parsedate_to_datetime
 from typing import TYPE_CHECKING, cast
 
 from litestar.datastructures import Cookie
@@ -26,19 +28,24 @@ from personal_growth_sdk.authorization.constants.http_headers import (
     HEADER_X_FORWARDED_FOR,
 )
 
+from app.config.base_settings import get_settings
 from app.config.route_registry import route_registry
 from app.lib.context import set_cookies, set_headers, set_upstream
 from app.lib.http.http_service import HttpService
 from app.lib.logger import logger
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import AsyncIterator, Iterable
 
     from litestar.types import ASGIApp, Receive, Scope, Send
 
 __all__ = ['ReverseProxyMiddleware']
 
-_HOP_BY_HOP = {
+# Import-time flag mirroring the logger configuration; per-request debug
+# tracing reduces to one boolean check when disabled.
+_DEBUG = get_settings().log.LEVEL <= logging.DEBUG
+
+_HOP_BY_HOP = frozenset({
     b'connection',
     b'keep-alive',
     b'te',
@@ -48,7 +55,16 @@ _HOP_BY_HOP = {
     b'proxy-authorization',
     b'transfer-encoding',
     b'host',
-}
+})
+
+# Response headers never forwarded downstream: Set-Cookie is handled
+# separately and the rest are managed by Litestar.
+_DROP = frozenset({
+    b'set-cookie',
+    b'content-length',
+    b'date',
+    b'server',
+})
 
 # ── convert once; the rest of the code works with bytes only  ──────────────
 HDR_XFF = HEADER_X_FORWARDED_FOR.lower().encode()  # b'x-forwarded-for'
@@ -72,64 +88,102 @@ def copy_request_headers(scope: Scope) -> list[tuple[bytes, bytes]]:
     """
 
     out: list[tuple[bytes, bytes]] = []
-    seen = {
-        HDR_XFF: False,
-        HDR_UA: False,
-        HDR_DFP: False,
-    }
+    has_xff = has_ua = has_dfp = False
 
+    # One lowercase per header, one set membership test, then three cheap
+    # equality checks — header copy runs for every proxied request.
     for name, value in scope['headers']:
-        if name.lower() in _HOP_BY_HOP:
+        low_name = name.lower()
+        if low_name in _HOP_BY_HOP:
             continue
 
-        low_name = name.lower()
-        if low_name in seen:
-            seen[low_name] = True
+        if low_name == HDR_XFF:
+            has_xff = True
+        elif low_name == HDR_UA:
+            has_ua = True
+        elif low_name == HDR_DFP:
+            has_dfp = True
 
         out.append((name, value))
 
-    if not seen[HDR_XFF]:
+    if not has_xff:
         client_ip = (scope.get('client') or ('',))[0]
         out.append((HDR_XFF, client_ip.encode('ascii')))
 
-    if not seen[HDR_UA]:
+    if not has_ua:
         out.append((HDR_UA, b''))
 
-    if not seen[HDR_DFP]:
+    if not has_dfp:
         out.append((HDR_DFP, b''))
 
     return out
 
 
-def _morsel_to_cookie(m: Morsel) -> Cookie:
+def _parse_one_set_cookie(line: str, now: datetime.datetime) -> Cookie | None:
     """
-    Converts a `Morsel` object from `http.cookies` to a Litestar `Cookie`.
+    Parses a single Set-Cookie header into a Litestar `Cookie`.
+
+    A straight split/partition pass with no `SimpleCookie`, regexes or
+    `Morsel` intermediaries — per-response cookie handling stays cheap even
+    when the upstream sets several cookies at once.
 
     Args:
-        m: Parsed morsel containing Set-Cookie data.
+        line: Raw Set-Cookie header value.
+        now: Current UTC time, computed once per response.
 
     Returns:
-        Cookie: Structured representation of the cookie.
+        Cookie, or None if the header carries no `name=value` pair.
     """
 
-    path = m['path'] or '/'
-    domain = m['domain'] or None
-    secure = bool(m['secure'])
-    httponly = bool(m['httponly'])
-    samesite = m['samesite'].lower() if m['samesite'] else 'lax'
-
-    # --- Max-Age / Expires --------------------------------------------------
-    max_age: int | None = int(m['max-age']) if m['max-age'] else None
-    if max_age is None and m['expires']:
-        # Upstream returned “Wdy, DD-Mon-YYYY HH:MM:SS GMT”
-        expires_dt = datetime.datetime.strptime(
-            m['expires'], '%a, %d-%b-%Y %H:%M:%S %Z'
-        ).replace(tzinfo=datetime.UTC)
-        max_age = int((expires_dt - datetime.datetime.now(datetime.UTC)).total_seconds())
+    parts = line.split(';')
+    key, sep, value = parts[0].strip().partition('=')
+    if not sep:
+        return None
+
+    path = '/'
+    domain: str | None = None
+    secure = False
+    httponly = False
+    samesite = 'lax'
+    max_age: int | None = None
+    expires: str | None = None
+
+    for raw in parts[1:]:
+        name, _, attr_value = raw.strip().partition('=')
+        lname = name.lower()
+        if lname == 'path' and attr_value:
+            path = attr_value
+        elif lname == 'domain' and attr_value:
+            domain = attr_value
+        elif lname == 'secure':
+            secure = True
+        elif lname == 'httponly':
+            httponly = True
+        elif lname == 'samesite' and attr_value:
+            samesite = attr_value.lower()
+        elif lname == 'max-age' and attr_value:
+            try:
+                max_age = int(attr_value)
+            except ValueError:
+                pass
+        elif lname == 'expires' and attr_value:
+            expires = attr_value
+
+    # Max-Age wins over Expires per RFC 6265 §4.1.2.2; the date parser from
+    # email.utils handles both the RFC 1123 and the legacy dashed format.
+    if max_age is None and expires:
+        try:
+            expires_dt = parsedate_to_datetime(expires)
+        except ValueError:
+            pass
+        else:
+            if expires_dt.tzinfo is None:
+                expires_dt = expires_dt.replace(tzinfo=datetime.UTC)
+            max_age = int((expires_dt - now).total_seconds())
 
     return Cookie(
-        key=m.key,
-        value=m.value,
+        key=key.strip(),
+        value=value,
         path=path,
         domain=domain,
         secure=secure,
@@ -151,11 +205,11 @@ def parse_set_cookie(headers: Iterable[str]) -> list[Cookie]:
     """
 
     cookies: list[Cookie] = []
+    now = datetime.datetime.now(datetime.UTC)
     for header in headers:
-        jar = SimpleCookie()
-        jar.load(header)
-        for morsel in jar.values():
-            cookies.append(_morsel_to_cookie(morsel))
+        cookie = _parse_one_set_cookie(header, now)
+        if cookie is not None:
+            cookies.append(cookie)
     return cookies
 
 
@@ -175,31 +229,26 @@ def clean_headers(raw: list[tuple[bytes, bytes]]) -> dict[str, str]:
         Dictionary of sanitized headers.
     """
 
-    drop = {
-        b'set-cookie',
-        b'content-length',
-        b'date',
-        b'server',
+    seen: set[bytes] = set()
+    return {
+        name.decode(): value.decode()
+        for name, value in raw
+        if (lname := name.lower()) not in _DROP and not (lname in seen or seen.add(lname))
     }
-    hdr: dict[str, str] = {}
-    for name, value in raw:
-        lname = name.lower()
-        if lname in drop:
-            continue
 
-        hdr.setdefault(name.decode(), value.decode())
-    return hdr
 
-
-async def read_body(receive: Receive) -> bytes:
+async def read_body(receive: Receive) -> list[bytes]:
     """
     Reads the entire body of the incoming request.
 
+    The chunks are returned as-is, without joining: callers replay or inspect
+    them and a contiguous copy is never materialized.
+
     Args:
         receive: ASGI receive callable.
 
     Returns:
-        The complete request body as bytes.
+        Non-empty body chunks in arrival order.
     """
 
     chunks: list[bytes] = []
@@ -212,37 +261,124 @@ async def read_body(receive: Receive) -> bytes:
 
         # tell the type-checker: “this **is** bytes”
         chunk = cast('bytes', message.get('body', b''))
-        chunks.append(chunk)
+        if chunk:
+            chunks.append(chunk)
 
         if not message.get('more_body', False):
             break
 
-    return b''.join(chunks)
+    return chunks
+
+
+async def iter_body(receive: Receive, tee: list[bytes]) -> AsyncIterator[bytes]:
+    """
+    Streams the incoming request body chunk by chunk.
+
+    Each `http.request` chunk is yielded to the consumer (httpx sends it
+    upstream immediately, so the dial does not wait for EOF) and appended to
+    `tee`, which keeps the only retained copy for downstream replay.
+
+    Args:
+        receive: ASGI receive callable.
+        tee: List collecting the chunks as they pass through.
+
+    Yields:
+        Non-empty body chunks in arrival order.
+    """
+
+    while True:
+        message = await receive()
+        if message['type'] != 'http.request':
+            continue
+
+        chunk = cast('bytes', message.get('body', b''))
+        if chunk:
+            tee.append(chunk)
+            yield chunk
+
+        if not message.get('more_body', False):
+            return
+
+
+# Shared terminal message; readers treat receive() payloads as immutable, so
+# one dict serves every drained stream.
+_EOF = {'type': 'http.request', 'body': b'', 'more_body': False}
+
+
+async def _empty_receive() -> dict:
+    """Module-level receive for bodyless requests — no per-request state."""
 
+    return _EOF
 
-def replay_body(body: bytes) -> Receive:
+
+class _ReplayBody:
+    """
+    Replays previously captured body chunks as a `receive()` callable.
+
+    A slotted instance instead of a closure: one small object per bodied
+    request, and bodyless requests (the common proxy case) share
+    `_empty_receive` with no allocation at all.
+    """
+
+    __slots__ = ('_chunks', '_index')
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+        self._index = 0
+
+    async def __call__(self) -> dict:
+        index = self._index
+        chunks = self._chunks
+        if index < len(chunks):
+            self._index = index + 1
+            return {'type': 'http.request', 'body': chunks[index], 'more_body': self._index < len(chunks)}
+        return _EOF
+
+
+def replay_body(chunks: list[bytes]) -> Receive:
     """
-    Reconstructs a `receive()` coroutine that replays the given body exactly once.
+    Builds a `receive()` callable that replays the given body chunks once.
 
     Useful for passing the same request payload downstream after reading it once.
 
     Args:
-        body: Request body previously read.
+        chunks: Body chunks previously read or teed off the upstream stream.
 
     Returns:
         A coroutine-compatible object simulating a fresh body stream.
     """
 
-    consumed = False
+    return _ReplayBody(chunks) if chunks else _empty_receive
+
+
+async def stream_send(send: Send, resp) -> None:
+    """
+    Streams the upstream response to the client chunk by chunk.
+
+    Used for error responses on the streaming proxy path: raw (still
+    content-encoded) chunks are forwarded as they arrive, so large upstream
+    error payloads are never buffered in full.
+
+    Args:
+        send: ASGI send callable.
+        resp: Streaming httpx response whose body has not been read.
+    """
 
-    async def _wrapper() -> dict:
-        nonlocal consumed
-        if not consumed:
-            consumed = True
-            return {'type': 'http.request', 'body': body, 'more_body': False}
-        return {'type': 'http.request', 'body': b'', 'more_body': False}
+    raw_headers = resp.headers.raw
+    if not isinstance(raw_headers, list):
+        raw_headers = list(raw_headers)
 
-    return _wrapper
+    await send(
+        {
+            'type': 'http.response.start',
+            'status': resp.status_code,
+            'headers': raw_headers,
+        }
+    )
+    async for chunk in resp.aiter_raw():
+        if chunk:
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+    await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
 
 
 async def direct_send(send: Send, resp):
@@ -256,14 +392,20 @@ async def direct_send(send: Send, resp):
         resp: HTTP response object returned by upstream.
     """
 
+    raw_headers = resp.headers.raw
+    if not isinstance(raw_headers, list):
+        raw_headers = list(raw_headers)
+
     await send(
         {
             'type': 'http.response.start',
             'status': resp.status_code,
-            'headers': list(resp.headers.raw),
+            'headers': raw_headers,
         }
     )
-    await send({'type': 'http.response.body', 'body': resp.content})
+    # Explicit more_body=False: some servers treat a missing flag as a
+    # still-open stream and hold the write side for an extra tick.
+    await send({'type': 'http.response.body', 'body': resp.content, 'more_body': False})
 
 
 class ReverseProxyMiddleware(ASGIMiddleware):
@@ -282,6 +424,79 @@ class ReverseProxyMiddleware(ASGIMiddleware):
 
     scopes = (ScopeType.HTTP,)
 
+    def __init__(self) -> None:
+        # In-flight idempotent upstream requests, keyed by everything that can
+        # change the upstream answer. Concurrent duplicates await the same
+        # round trip instead of issuing their own.
+        self._inflight: dict[tuple[str, str, bytes, bytes], asyncio.Future] = {}
+
+    async def _fetch_upstream(
+            self,
+            scope: Scope,
+            method: str,
+            target: str,
+            req_headers: list[tuple[bytes, bytes]],
+            receive: Receive,
+            tee: list[bytes],
+    ):
+        """
+        Issue a GET/HEAD upstream request, coalescing identical concurrent calls.
+
+        Bodyless idempotent requests with the same method, target, query
+        string and cookies share a single upstream round trip. Bodied methods
+        never reach here — they take the streaming path in `handle`.
+
+        Args:
+            scope: ASGI scope of the incoming request.
+            method: HTTP method.
+            target: Fully resolved upstream URL.
+            req_headers: Headers prepared for the upstream call.
+            receive: ASGI receive callable, not yet consumed.
+            tee: List that collects body chunks for replay to the next app.
+
+        Returns:
+            The upstream `httpx.Response`.
+        """
+
+        query = scope['query_string']
+        # GET/HEAD bodies are atypical; drain the (almost always empty) body
+        # so the coalescing key stays correct.
+        tee.extend(await read_body(receive))
+        if tee:
+            return await HttpService.raw_request(
+                method=method,
+                url=target,
+                headers=req_headers,
+                content=b''.join(tee),
+                params=query.decode() or None,
+            )
+
+        cookie = next((value for name, value in scope['headers'] if name.lower() == b'cookie'), b'')
+        key = (method, target, query, cookie)
+
+        fut = self._inflight.get(key)
+        if fut is not None:
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            resp = await HttpService.raw_request(
+                method=method,
+                url=target,
+                headers=req_headers,
+                params=query.decode() or None,
+            )
+        except BaseException as exc:
+            fut.set_exception(exc)
+            fut.exception()  # mark retrieved even when no duplicate is waiting
+            raise
+        else:
+            fut.set_result(resp)
+            return resp
+        finally:
+            self._inflight.pop(key, None)
+
     async def handle(
             self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
     ) -> None:
@@ -292,7 +507,7 @@ class ReverseProxyMiddleware(ASGIMiddleware):
         - Resolves whether the request matches a registered external service.
         - If not, it passes the request through to the next ASGI app.
         - If matched:
-            * It reads and stores the request body.
+            * It streams the request body to the upstream, teeing chunks for replay.
             * Copies all relevant headers (preserving necessary metadata).
             * Forwards the request to the upstream using the `HttpService`.
             * If the upstream responds with an error (status >= 400), it streams the
@@ -311,32 +526,43 @@ class ReverseProxyMiddleware(ASGIMiddleware):
         """
 
         method, path = scope['method'], scope['path']
-        upstream, tail = route_registry.resolve(method, path)
+        target = route_registry.resolve_url(method, path)
 
         # ------------- local route -----------------------------------------
-        if upstream is None:
+        if target is None:
             await next_app(scope, receive, send)
             return
 
-        target = f'{upstream}{tail}'
-        logger.debug('Proxy → %s %s', method, target)
+        if _DEBUG:
+            logger.debug('Proxy → %s %s', method, target)
 
         # ------------- build proxied request -------------------------------
-        body = await read_body(receive)
         req_headers = copy_request_headers(scope)
 
-        resp = await HttpService.raw_request(
-            method=method,
-            url=target,
-            headers=req_headers,
-            content=body or None,
-            params=scope['query_string'].decode() or None,
-        )
-
-        # ------------- error? return upstream response as-is ---------------
-        if resp.status_code >= HTTP_400_BAD_REQUEST:
-            await direct_send(send, resp)
-            return
+        tee: list[bytes] = []
+        if method in ('GET', 'HEAD'):
+            resp = await self._fetch_upstream(scope, method, target, req_headers, receive, tee)
+
+            # ------------- error? return upstream response as-is -----------
+            if resp.status_code >= HTTP_400_BAD_REQUEST:
+                await direct_send(send, resp)
+                return
+        else:
+            # Bodied methods stream in both directions: the request body is
+            # piped as it arrives, and an error response is relayed chunk by
+            # chunk without ever materializing it. Only the success path
+            # buffers, because downstream handlers read the payload.
+            async with HttpService.stream_request(
+                method=method,
+                url=target,
+                headers=req_headers,
+                content=iter_body(receive, tee),
+                params=scope['query_string'].decode() or None,
+            ) as resp:
+                if resp.status_code >= HTTP_400_BAD_REQUEST:
+                    await stream_send(send, resp)
+                    return
+                await resp.aread()
 
         # ------------- success → pass data downstream ----------------------
         set_upstream(scope, resp.content)
@@ -345,4 +571,4 @@ class ReverseProxyMiddleware(ASGIMiddleware):
         hdr_dict = clean_headers(resp.headers.raw)
         set_headers(scope, hdr_dict)
 
-        await next_app(scope, replay_body(body), send)
+        await next_app(scope, replay_body(tee), send)
@@ -10,11 +10,18 @@ from app.config.base_settings import get_settings
 
 settings = get_settings()
 
+# One documentation UI is enough in production; the extra renderers only add
+# route handlers and static payloads, so they stay development-only.
+if settings.app.MODE == 'PROD':
+    _render_plugins = [ScalarRenderPlugin()]
+else:
+    _render_plugins = [ScalarRenderPlugin(), SwaggerRenderPlugin(), RedocRenderPlugin()]
+
 # Main OpenAPI configuration
 config = OpenAPIConfig(
     title=settings.app.NAME,
     version=settings.app.VERSION,
     use_handler_docstrings=True,
-    render_plugins=[ScalarRenderPlugin(), SwaggerRenderPlugin(), RedocRenderPlugin()],  # Scalar documentation UI
+    render_plugins=_render_plugins,  # Scalar documentation UI
     path='/docs'  # Documentation endpoint path
 )
@@ -82,8 +82,9 @@ def provide_select_in_str_filter[T](
     Returns:
         CollectionFilter[str]: Filter for a scoping query to a limited set of values.
     """
-    processed_values = values.split(',') if values else []
-    processed_values = [value.strip() for value in processed_values if value != '']
+    # One pass: strip each token as it is split and drop empties, instead of
+    # splitting, re-filtering and stripping in separate sweeps.
+    processed_values = [v for v in (token.strip() for token in values.split(',')) if v] if values else []
 
     return CollectionFilter(field_name=column, values=processed_values)
 
@@ -232,16 +233,16 @@ def provide_filter_dependencies(
     Returns:
         list[FilterTypes]: List of filters parsed from connection.
     """
-    filters: list[FilterTypes] = []
+    # Runs once per paginated request: start from the three always-present
+    # filters and append the optional ones — no empty-list-then-extend dance.
+    filters: list[FilterTypes] = [created_filter, limit_offset, updated_filter]
     if id_filter.values:
         filters.append(id_filter)
-    filters.extend([created_filter, limit_offset, updated_filter])
-
     if search_filter.field_name is not None and search_filter.value is not None:
         filters.append(search_filter)
     if order_by.field_name is not None:
         filters.append(order_by)
-    if select_in_str_filter.values is not None and select_in_str_filter.field_name is not None:
+    if select_in_str_filter.values and select_in_str_filter.field_name:
         filters.append(select_in_str_filter)
     return filters
 